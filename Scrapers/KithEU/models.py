@@ -1,8 +1,7 @@
-from dataclasses import dataclass
+from ..compact import slotted_dataclass
 from typing import List
-from discord import Embed
 
-@dataclass
+@slotted_dataclass
 class Variant:
     pid: str
     sku: str
@@ -11,7 +10,7 @@ class Variant:
     quantity: str
     link: str
 
-@dataclass
+@slotted_dataclass
 class Product:
     pid: str
     sku: str
@@ -30,6 +29,8 @@ class Product:
         return f"{self.title} by {self.vendor} | {self.description}"
     
     def to_embed(self):
+        from discord import Embed
+
         embed = Embed(
             title=self.title,
             description=self.pid,
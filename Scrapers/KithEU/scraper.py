@@ -1,16 +1,36 @@
 import requests
 import logging
-from models import *
-from typing import Optional
+from urllib.parse import quote
+from .models import *
+from ..decoding import decode
+from ..compact import intern_str, make_model
+from ..metrics import timed
+from ..transport import Transport, get_default_transport
+from ..async_transport import AsyncTransport, get_default_async_transport
+from .sweep import get_default_sweep_cache
+from typing import Iterator, List, Optional, Tuple
 
 class Scraper:
-    BASE_URL = (
-        "https://searchserverapi.com/getwidgets?api_key=3c7s6k4F2C&_=ci&maxResults=1&q="
-    )
+    SEARCH_URL = "https://searchserverapi.com/getwidgets?api_key=3c7s6k4F2C&_=ci"
+    BASE_URL = SEARCH_URL + "&maxResults=1&q="
     STORE_URL = "https://eu.kith.com/"
+    MAX_RESULTS = 250 # Results per page of a search sweep
 
-    def __init__(self, pid):
+    def __init__(
+        self,
+        pid,
+        transport: Optional[Transport] = None,
+        async_transport: Optional[AsyncTransport] = None,
+        lazy: bool = False,
+        sweep_cache=None,
+    ):
         self.pid = pid
+        self.transport = transport or get_default_transport()
+        self.async_transport = async_transport or get_default_async_transport()
+        self.lazy = lazy  # Build variants only when first accessed
+        # Optional SweepCache answering scrape_data from one shared search sweep
+        self.sweep_cache = sweep_cache if sweep_cache is not None else get_default_sweep_cache()
+        self.search_cursor = None  # startIndex iter_search resumes from (None once finished)
 
     def _get_url(self) -> str:
         return self.BASE_URL + self.pid
@@ -25,27 +45,126 @@ class Scraper:
         try:
             endpoint = self._get_url()
             headers = self._get_headers()
-            response = requests.get(url=endpoint, headers=headers)
+            response = self.transport.get(url=endpoint, headers=headers)
             response.raise_for_status()
-            return response.json()
+            return decode(response.content, ("items", 0)) # Only the first hit is read
         except requests.exceptions.RequestException as e:
             logging.error(f"Scrape failed: {e}")
             return None
 
-    def _parse_response(self, product_data) -> Product:
+    async def _fetch_async(self) -> Optional[dict]:
+        try:
+            endpoint = self._get_url()
+            headers = self._get_headers()
+            response = await self.async_transport.get(url=endpoint, headers=headers)
+            response.raise_for_status()
+            return decode(response.content, ("items", 0))
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
+
+    def _get_search_url(self, query: str, start: int, max_results: int) -> str:
+        return f"{self.SEARCH_URL}&maxResults={max_results}&startIndex={start}&q={quote(query)}"
+
+    def _fetch_page(self, url: str) -> Optional[dict]:
+        try:
+            response = self.transport.get(url=url, headers=self._get_headers())
+            response.raise_for_status()
+            return decode(response.content)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Search failed: {e}")
+            return None
+
+    async def _fetch_page_async(self, url: str) -> Optional[dict]:
+        try:
+            response = await self.async_transport.get(url=url, headers=self._get_headers())
+            response.raise_for_status()
+            return decode(response.content)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Search failed: {e}")
+            return None
+
+    def _parse_search_page(self, data, start: int, lazy: bool) -> Tuple[List[Product], Optional[int]]:
+        # Returns the page's products and the next startIndex (None after the last page)
+        items = data.get("items") or []
+        next_start = start + len(items)
+        if not items or next_start >= int(data.get("totalItems") or 0):
+            next_start = None
+        products = []
+        for item in items:
+            try:
+                if lazy:
+                    # Deferred variants would only fail once accessed; check their keys now
+                    self._check_variants(item["shopify_variants"])
+                products.append(self._parse_response(item, lazy=lazy))
+            except (KeyError, TypeError) as e:
+                # e.g. items without a Size option; skip them rather than the whole sweep
+                logging.warning(f"Skipping search hit {item.get('product_code', '?')}: {e!r}")
+        return products, next_start
+
+    @staticmethod
+    def _check_variants(variants):
+        # Raises KeyError/TypeError for variants _parse_response can't build
+        for variant_data in variants:
+            for key in ("variant_id", "sku", "price", "link"):
+                variant_data[key]
+            variant_data["options"]["Size"]
+
+    def iter_search(self, query: str = "", max_results: int = MAX_RESULTS, cursor: int = 0) -> Iterator[Product]:
+        """
+        Yields every hit of a search query, max_results hits per request.
+
+        An empty query lists the whole store. self.search_cursor is the
+        startIndex to resume from and None once the last page was read; a
+        failed page stops iteration with the cursor on that page.
+        """
+        start = cursor
+        while start is not None:
+            self.search_cursor = start
+            data = self._fetch_page(self._get_search_url(query, start, max_results))
+            if data is None:
+                return
+            products, start = self._parse_search_page(data, start, self.lazy)
+            del data
+            yield from products
+        self.search_cursor = None
+
+    async def iter_search_async(self, query: str = "", max_results: int = MAX_RESULTS, cursor: int = 0):
+        """
+        Non-blocking variant of iter_search (an async generator).
+        """
+        start = cursor
+        while start is not None:
+            self.search_cursor = start
+            data = await self._fetch_page_async(self._get_search_url(query, start, max_results))
+            if data is None:
+                return
+            products, start = self._parse_search_page(data, start, self.lazy)
+            del data
+            for product in products:
+                yield product
+        self.search_cursor = None
+
+    @timed("parse")
+    def _parse_response(self, product_data, lazy: bool = False) -> Product:
         # Parse the product variant information
         def _parse_variant(variant_data) -> Variant:
             return Variant(
                 pid=variant_data["variant_id"],
                 sku=variant_data["sku"],
-                price=variant_data["price"],
-                size=variant_data["options"]["Size"],
+                price=intern_str(variant_data["price"]),
+                size=intern_str(variant_data["options"]["Size"]),
                 quantity=variant_data.get("quantity_total", "0"),
                 link=self.STORE_URL + variant_data["link"],
             )
 
         # Parse the product information
-        return Product(
+        return make_model(
+            Product,
+            lazy,
+            deferred={
+                "variants": lambda: [_parse_variant(v) for v in product_data["shopify_variants"]],
+            },
             pid=product_data.get("product_id", "UNKNOWN"),
             sku=product_data["product_code"],
             title=product_data["title"],
@@ -53,20 +172,35 @@ class Scraper:
             link=self.STORE_URL + product_data["link"],
             price=product_data["price"],
             image=product_data["image_link"],
-            vendor=product_data["vendor"],
+            vendor=intern_str(product_data["vendor"]),
             discount=product_data["discount"],
             total_reviews=product_data["total_reviews"],
             images=product_data["shopify_images"],
-            variants=[_parse_variant(v) for v in product_data["shopify_variants"]],
         )
 
+    @timed("scrape")
     def scrape_data(self) -> Optional[Product]:
-        data = self._fetch()
+        if self.sweep_cache is not None:
+            product = self.sweep_cache.get(self.pid)
+            if product is not None:
+                return product
+        data = self._fetch() # Not covered by the sweep
         if data is None:
             return None
-        parsed_data = self._parse_response(data["items"][0])
+        parsed_data = self._parse_response(data, lazy=self.lazy)
         return parsed_data
 
+    @timed("scrape")
+    async def scrape_data_async(self) -> Optional[Product]:
+        if self.sweep_cache is not None:
+            product = await self.sweep_cache.get_async(self.pid)
+            if product is not None:
+                return product
+        data = await self._fetch_async()
+        if data is None:
+            return None
+        return self._parse_response(data, lazy=self.lazy)
+
 
 if __name__ == "__main__":
     scraper = Scraper("aajs0727")
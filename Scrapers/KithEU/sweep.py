@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+
+class SweepCache:
+    """
+    Answers Kith lookups by product code from one shared search sweep.
+
+    A sweep pages through every hit of `queries` (the whole store by
+    default) with wide maxResults pages, so a watchlist of hundreds of Kith
+    products costs a few requests per `ttl` instead of one request per
+    product. Concurrent lookups wait for a single sweep. Codes that the sweep
+    doesn't cover return None, and the scraper falls back to its own request.
+    If a sweep fails partway, products it didn't reach keep their previous
+    result.
+    """
+
+    def __init__(
+        self,
+        queries: Iterable[str] = ("",), # Search queries swept; "" lists the whole store
+        ttl: float = 60, # Seconds a sweep is served before the next lookup sweeps again
+        max_results: Optional[int] = None, # Hits per request, defaults to Scraper.MAX_RESULTS
+        transport=None,
+        async_transport=None,
+        lazy: bool = False,
+    ):
+        self.queries = tuple(queries)
+        self.ttl = ttl
+        self.max_results = max_results
+        self.transport = transport
+        self.async_transport = async_transport
+        self.lazy = lazy
+        self._products: Dict[str, object] = {} # Upper-case product code -> Product
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._async_lock = None
+
+    @staticmethod
+    def _key(code: str) -> str:
+        return code.strip().upper()
+
+    def _scraper(self):
+        from .scraper import Scraper
+
+        return Scraper(
+            "", transport=self.transport, async_transport=self.async_transport, lazy=self.lazy
+        )
+
+    def _store(self, products: Dict[str, object], complete: bool):
+        if not complete:
+            products = {**self._products, **products}
+        self._products = products
+        self._expires_at = time.monotonic() + self.ttl
+
+    def refresh(self):
+        """
+        Runs a sweep now and replaces the cached products.
+        """
+        scraper = self._scraper()
+        max_results = self.max_results or scraper.MAX_RESULTS
+        products = {}
+        complete = True
+        for query in self.queries:
+            for product in scraper.iter_search(query, max_results):
+                products[self._key(product.sku)] = product
+            complete = complete and scraper.search_cursor is None
+        self._store(products, complete)
+
+    async def refresh_async(self):
+        """
+        Non-blocking variant of refresh().
+        """
+        scraper = self._scraper()
+        max_results = self.max_results or scraper.MAX_RESULTS
+        products = {}
+        complete = True
+        for query in self.queries:
+            async for product in scraper.iter_search_async(query, max_results):
+                products[self._key(product.sku)] = product
+            complete = complete and scraper.search_cursor is None
+        self._store(products, complete)
+
+    def _fresh(self) -> bool:
+        return time.monotonic() < self._expires_at
+
+    def get(self, code: str):
+        """
+        Returns the product with this code from the current sweep, sweeping first if it is stale.
+        """
+        if not self._fresh():
+            with self._lock:
+                if not self._fresh():
+                    self.refresh()
+        return self._products.get(self._key(code))
+
+    async def get_async(self, code: str):
+        if not self._fresh():
+            if self._async_lock is None:
+                self._async_lock = asyncio.Lock()
+            async with self._async_lock:
+                if not self._fresh():
+                    await self.refresh_async()
+        return self._products.get(self._key(code))
+
+    def __len__(self):
+        return len(self._products)
+
+    def __contains__(self, code: str):
+        return self._key(code) in self._products
+
+
+_default_cache: Optional[SweepCache] = None
+
+
+def get_default_sweep_cache() -> Optional[SweepCache]:
+    """
+    Returns the sweep cache shared by Kith scrapers, or None if every scrape sends its own request (the default).
+    """
+    return _default_cache
+
+
+def set_default_sweep_cache(cache: Optional[SweepCache]):
+    """
+    Serves every Kith scraper created afterwards (including the Monitor's) from cache.
+    """
+    global _default_cache
+    _default_cache = cache
@@ -1,23 +1,25 @@
-from dataclasses import dataclass
-from typing import List
-from discord import Embed
+from ..compact import slotted_dataclass
+from typing import TYPE_CHECKING, List
 
-@dataclass
+if TYPE_CHECKING:
+    from discord import Embed
+
+@slotted_dataclass
 class Category:
     name: str
     key: str
     url: str
 
-@dataclass
+@slotted_dataclass
 class Brand:
     name: str
     logo: str
     
-@dataclass
+@slotted_dataclass
 class Image:
     url: str
 
-@dataclass
+@slotted_dataclass
 class Product:
     pid: str
     name: str
@@ -34,7 +36,9 @@ class Product:
     def __str__(self):
         return f"{self.name} by {self.brand.name} ({self.pid})"
     
-    def to_embed(self) -> Embed:
+    def to_embed(self) -> "Embed":
+        from discord import Embed
+
         embed = Embed(
             title=self.name,
             url=f"https://www.lego.com/en-de/product/{self.slug}",
@@ -1,8 +1,10 @@
-from dataclasses import dataclass
-from typing import Optional, List
-from discord import Embed
+from ..compact import slotted_dataclass
+from typing import TYPE_CHECKING, Optional, List
 
-@dataclass
+if TYPE_CHECKING:
+    from discord import Embed
+
+@slotted_dataclass
 class Brand:
     logo: str
     name: str
@@ -10,7 +12,7 @@ class Brand:
     show: bool
     url: str
 
-@dataclass
+@slotted_dataclass
 class Product:
     pid: int
     ians: List[str]
@@ -27,7 +29,9 @@ class Product:
     def __str__(self):
         return f"{self.title} by {self.brand.name} ({self.pid})"
 
-    def to_embed(self) -> Embed:
+    def to_embed(self) -> "Embed":
+        from discord import Embed
+
         embed = Embed(
             title=self.title,
             url=self.brand.url,
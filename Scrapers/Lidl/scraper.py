@@ -1,20 +1,36 @@
+import asyncio
 import requests
-from models import *
+from .models import *
+from ..decoding import decode
+from ..compact import intern_str
+from ..metrics import timed
+from ..transport import Transport, get_default_transport
+from ..async_transport import AsyncTransport, get_default_async_transport
 import logging
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
 class Scraper:
     BASE_URL = "https://www.lidl.de/p/api/gridboxes/DE/de?erpNumbers="
+    MAX_URL_LENGTH = 2000 # Stay below common proxy/CDN URL limits
+    MAX_BATCH_SIZE = 100 # Max ERP numbers packed into one request
     
-    def __init__(self, pid):
+    def __init__(
+        self,
+        pid,
+        transport: Optional[Transport] = None,
+        async_transport: Optional[AsyncTransport] = None,
+    ):
         self.pid = pid
+        self.transport = transport or get_default_transport()
+        self.async_transport = async_transport or get_default_async_transport()
      
     @staticmethod  
+    @timed("parse")
     def _parse_response(response_data) -> Product:
         def _parse_brand(brand_data) -> Brand:
             return Brand(
                 logo=brand_data['logo'],
-                name=brand_data['name'],
+                name=intern_str(brand_data['name']),
                 url=brand_data['url'],
                 pid=brand_data['id'],
                 show=brand_data['showBrand']
@@ -27,7 +43,7 @@ class Scraper:
         return Product(
             pid=response_data.get('productId', 'N/A'),
             ians=response_data.get('ians'),
-            product_type=response_data.get('productType', 'N/A'),
+            product_type=intern_str(response_data.get('productType', 'N/A')),
             rating=response_data.get('ratings', {}).get('average', 0.0),
             title=response_data.get('title', 'N/A'),
             price=response_data.get('price', {}).get('price', 0),
@@ -38,21 +54,118 @@ class Scraper:
             brand=_parse_brand(response_data.get('brand', {}))
         )
         
+    @classmethod
+    def _get_url(cls, pids: List[str]) -> str:
+        return cls.BASE_URL + ",".join(pids)
+
+    @classmethod
+    def _chunk_pids(cls, pids: List[str]) -> List[List[str]]:
+        # Pack as many ERP numbers per request as the URL length allows
+        chunks = []
+        chunk = []
+        length = len(cls.BASE_URL)
+        for pid in pids:
+            extra = len(pid) + (1 if chunk else 0)
+            if chunk and (length + extra > cls.MAX_URL_LENGTH or len(chunk) >= cls.MAX_BATCH_SIZE):
+                chunks.append(chunk)
+                chunk = []
+                length = len(cls.BASE_URL)
+                extra = len(pid)
+            chunk.append(pid)
+            length += extra
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @classmethod
+    def _map_results(cls, data: list, results: Dict[str, Optional[Product]]):
+        # The gridbox array is not guaranteed to follow the requested order
+        for item in data:
+            key = str(item.get('erpNumber') or item.get('productId'))
+            if key in results:
+                results[key] = cls._parse_response(item)
+
     def _fetch(self) -> Optional[dict]:
         try:
-            response = requests.get(self.BASE_URL + self.pid)
+            response = self.transport.get(self.BASE_URL + self.pid)
+            response.raise_for_status()
+            return decode(response.content, (0,)) # Only the first gridbox is read
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
+
+    async def _fetch_async(self) -> Optional[dict]:
+        try:
+            response = await self.async_transport.get(self.BASE_URL + self.pid)
             response.raise_for_status()
-            return response.json()
+            return decode(response.content, (0,))
         except requests.exceptions.RequestException as e:
             logging.error(f"Scrape failed: {e}")
             return None
     
+    @timed("scrape")
     def scrape_data(self) -> Optional[Product]:
         data = self._fetch()
         if data is None:
             return None
-        parsed_data = self._parse_response(data[0])
+        parsed_data = self._parse_response(data)
         return parsed_data
+
+    @timed("scrape")
+    async def scrape_data_async(self) -> Optional[Product]:
+        data = await self._fetch_async()
+        if data is None:
+            return None
+        return self._parse_response(data)
+
+    @classmethod
+    @timed("batch")
+    def scrape_batch(
+        cls, pids: Iterable[str], transport: Optional[Transport] = None
+    ) -> Dict[str, Optional[Product]]:
+        """
+        Fetches many products with one gridboxes request per chunk of ERP numbers.
+
+        Returns:
+            dict: Requested PID -> Product, or None if it was not returned.
+        """
+        transport = transport or get_default_transport()
+        results = {str(pid): None for pid in pids}
+        for chunk in cls._chunk_pids(list(results)):
+            try:
+                response = transport.get(cls._get_url(chunk))
+                response.raise_for_status()
+                data = decode(response.content)
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Batch scrape failed: {e}")
+                continue
+            cls._map_results(data, results)
+        return results
+
+    @classmethod
+    @timed("batch")
+    async def scrape_batch_async(
+        cls, pids: Iterable[str], async_transport: Optional[AsyncTransport] = None
+    ) -> Dict[str, Optional[Product]]:
+        """
+        Non-blocking variant of scrape_batch, fetching all chunks concurrently.
+        """
+        async_transport = async_transport or get_default_async_transport()
+        results = {str(pid): None for pid in pids}
+
+        async def _fetch_chunk(chunk):
+            try:
+                response = await async_transport.get(cls._get_url(chunk))
+                response.raise_for_status()
+                return decode(response.content)
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Batch scrape failed: {e}")
+                return []
+
+        chunks = cls._chunk_pids(list(results))
+        for data in await asyncio.gather(*[_fetch_chunk(c) for c in chunks]):
+            cls._map_results(data, results)
+        return results
     
 if __name__ == "__main__":
     scraper = Scraper("100270851")
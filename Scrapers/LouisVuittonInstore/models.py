@@ -1,26 +1,28 @@
-from dataclasses import dataclass
-from typing import List, Optional
-from discord_webhook import DiscordEmbed
+from ..compact import slotted_dataclass
+from typing import TYPE_CHECKING, List, Optional
 
-@dataclass
+if TYPE_CHECKING:
+    from discord_webhook import DiscordEmbed
+
+@slotted_dataclass
 class GeoLocation:
     latitude: float
     longitude: float
     
-@dataclass
+@slotted_dataclass
 class Address:
     street: str
     postal_code: str
     city: str
     country: str
     
-@dataclass
+@slotted_dataclass
 class WorkingHours:
     day_of_week: str
     opens: str
     closes: str
     
-@dataclass
+@slotted_dataclass
 class Propertys:
     available: bool = False
     flagship: bool = False
@@ -28,7 +30,7 @@ class Propertys:
     display_locate_in_store: bool = False
     estimated_delivery_date: Optional[int] = None
 
-@dataclass
+@slotted_dataclass
 class Store:
     name: str
     telephone: str
@@ -41,7 +43,7 @@ class Store:
     working_hours: List[WorkingHours]
     propertys: Propertys
     
-@dataclass
+@slotted_dataclass
 class Sku:
     sku: str
     name: str
@@ -50,7 +52,7 @@ class Sku:
     color: str
     image: str
     
-@dataclass
+@slotted_dataclass
 class Product:
     name: str
     sku: str
@@ -65,7 +67,9 @@ class Product:
     def __str__(self):
         return f"{self.name} ({self.product_id})"
     
-    def to_embed(self) -> DiscordEmbed:
+    def to_embed(self) -> "DiscordEmbed":
+        from discord_webhook import DiscordEmbed
+
         embed = DiscordEmbed(
             title=self.name,
             description=f"🧾 **SKU:** `{self.sku}`\n🆔 **ID:** `{self.product_id}`",
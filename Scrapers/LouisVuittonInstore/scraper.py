@@ -1,11 +1,57 @@
+import asyncio
 import requests
-from models import *
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from .models import *
+from ..decoding import DecodeError, decode
+from ..compact import intern_str, make_model
+from ..metrics import submit, timed
+from ..offload import get_default_parse_pool
+from .store_directory import get_default_store_directory
+from ..transport import get_default_transport
+from ..async_transport import get_default_async_transport
 import logging
 
+_store_executor = None
+_store_executor_lock = threading.Lock()
+
+
+def _get_store_executor():
+    # Shared pool for the store queries of the blocking scrape path
+    global _store_executor
+    if _store_executor is None:
+        with _store_executor_lock:
+            if _store_executor is None:
+                _store_executor = ThreadPoolExecutor(
+                    max_workers=32, thread_name_prefix="lv-stores"
+                )
+    return _store_executor
+
+
 class Scraper:
-    def __init__(self, pid, city=""):
+    STORES_URL = "https://api.louisvuitton.com/eco-eu/search-merch-eapi/v1/deu-de/stores/query"
+
+    def __init__(
+        self,
+        pid,
+        city="",
+        transport=None,
+        async_transport=None,
+        max_concurrency=8, # Max store queries in flight per product
+        store_directory=None,
+        lazy=False, # Build skus/stores only when first accessed
+        parse_pool=None, # Optional ParsePool for large store responses
+    ):
         self.city = city
         self.pid = pid
+        self.transport = transport or get_default_transport()
+        self.async_transport = async_transport or get_default_async_transport()
+        self.max_concurrency = max_concurrency
+        self.store_directory = (
+            store_directory if store_directory is not None else get_default_store_directory()
+        )
+        self.lazy = lazy
+        self.parse_pool = parse_pool or get_default_parse_pool()
 
     def _get_headers(self) -> dict:
         return {
@@ -38,28 +84,63 @@ class Scraper:
             "locale": "de_DE",
         }
 
+    def _get_mobile_url(self) -> str:
+        return f"https://pass-api.louisvuitton.com/api/catalog/product/{self.pid}"
+
+    def _get_store_query(self, sku_id) -> dict:
+        return {
+            "country": "DE",
+            "query": self.city,
+            "clickAndCollect": False,
+            "skuId": sku_id,
+            "pageType": "buypath",
+        }
+
     def _fetch_mobile(self) -> dict:
         params = self._get_params()
         headers = self._get_mobile_headers()
-        response = requests.get(
-            f"https://pass-api.louisvuitton.com/api/catalog/product/{self.pid}",
+        response = self.transport.get(
+            self._get_mobile_url(),
+            params=params,
+            headers=headers,
+        )
+        return decode(response.content)
+
+    async def _fetch_mobile_async(self) -> dict:
+        params = self._get_params()
+        headers = self._get_mobile_headers()
+        response = await self.async_transport.get(
+            self._get_mobile_url(),
             params=params,
             headers=headers,
         )
-        return response.json()
+        return decode(response.content)
+
+    def _fetch(self, url, json_data, raw=False) -> dict:
+        try:
+            headers = self._get_headers()
+            response = self.transport.post(url, json=json_data, headers=headers, idempotent=True)
+            response.raise_for_status()
+            return response.content if raw else decode(response.content)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
 
-    def _fetch(self, url, json_data) -> dict:
+    async def _fetch_async(self, url, json_data, raw=False) -> dict:
         try:
             headers = self._get_headers()
-            response = requests.post(url, json=json_data, headers=headers)
+            response = await self.async_transport.post(url, json=json_data, headers=headers, idempotent=True)
             response.raise_for_status()
-            return response.json()
+            return response.content if raw else decode(response.content)
         except requests.exceptions.RequestException as e:
             logging.error(f"Scrape failed: {e}")
             return None
 
     @staticmethod
-    def _parse_product(product_data) -> Product:
+    @timed("parse")
+    def _parse_product(product_data, store_directory=None, lazy=False) -> Product:
+        if store_directory is None:
+            store_directory = get_default_store_directory()
 
         def _parse_sku(sku_data) -> Sku:
 
@@ -75,15 +156,15 @@ class Scraper:
                     return Address(
                         street=address_data.get("streetAddress", "N/A"),
                         postal_code=address_data.get("postalCode", "N/A"),
-                        city=address_data.get("addressLocality", "N/A"),
-                        country=address_data.get("addressCountry", "N/A"),
+                        city=intern_str(address_data.get("addressLocality", "N/A")),
+                        country=intern_str(address_data.get("addressCountry", "N/A")),
                     )
 
                 def _parse_working_hours(working_data) -> WorkingHours:
                     return WorkingHours(
-                        day_of_week=working_data["dayOfWeek"],
-                        opens=working_data["opens"],
-                        closes=working_data["closes"],
+                        day_of_week=intern_str(working_data["dayOfWeek"]),
+                        opens=intern_str(working_data["opens"]),
+                        closes=intern_str(working_data["closes"]),
                     )
 
                 def _parse_propertys(property_data) -> Propertys:
@@ -116,41 +197,59 @@ class Scraper:
                         estimated_delivery_date=estimated_cc_delivery_date,
                     )
 
+                # Static store data is parsed once and shared across SKUs and polls
+                identifier = store_data.get("identifier")
+                static = store_directory.get(identifier) if identifier else None
+                if static is None:
+                    static = dict(
+                        name=intern_str(store_data.get("name", "N/A")),
+                        telephone=store_data.get("telephone", "N/A"),
+                        identiefer=store_data.get("identifier", "N/A"),
+                        brand=intern_str(store_data.get("brand")),
+                        geo=_parse_geo_location(store_data.get("geo", {})),
+                        url=store_data.get("url", "N/A"),
+                        address=_parse_address(store_data.get("address", {})),
+                        image=store_data.get("image", [])[0].get("contentUrl", "N/A"),
+                        working_hours=[
+                            _parse_working_hours(working_data)
+                            for working_data in store_data.get("hoursAvailable", [])
+                        ],
+                    )
+                    if identifier:
+                        store_directory.put(identifier, static)
+
                 return Store(
-                    name=store_data.get("name", "N/A"),
-                    telephone=store_data.get("telephone", "N/A"),
-                    identiefer=store_data.get("identifier", "N/A"),
-                    brand=store_data.get("brand"),
-                    geo=_parse_geo_location(store_data.get("geo", {})),
-                    url=store_data.get("url", "N/A"),
-                    address=_parse_address(store_data.get("address", {})),
-                    image=store_data.get("image", [])[0].get("contentUrl", "N/A"),
-                    working_hours=[
-                        _parse_working_hours(working_data)
-                        for working_data in store_data.get("hoursAvailable", [])
-                    ],
+                    **static,
                     propertys=_parse_propertys(
                         store_data.get("additionalProperty", {})
                     ),
                 )
 
-            return Sku(
+            return make_model(
+                Sku,
+                lazy,
+                deferred={
+                    "stores": lambda: [
+                        _parse_store(store_data) for store_data in sku_data.get("store", {})
+                    ],
+                },
                 sku=sku_data.get("skuId", "N/A"),
                 name=sku_data.get("name", "N/A"),
-                size=sku_data.get("size", "N/A"),
-                stores=[
-                    _parse_store(store_data) for store_data in sku_data.get("store", {})
-                ],
-                color=sku_data.get("color", "N/A"),
+                size=intern_str(sku_data.get("size", "N/A")),
+                color=intern_str(sku_data.get("color", "N/A")),
                 image=sku_data.get("mediaUrl", "N/A"),
             )
 
-        return Product(
+        return make_model(
+            Product,
+            lazy,
+            deferred={
+                "skus": lambda: [_parse_sku(sku_data) for sku_data in product_data.get("skus", [])],
+            },
             name=product_data.get("name", "N/A"),
             sku=product_data.get("sku", "N/A"),
             product_id=product_data.get("productId", "N/A"),
             link=product_data.get("webPath", "N/A"),
-            skus=[_parse_sku(sku_data) for sku_data in product_data.get("skus", [])],
             is_back_order=product_data.get("isBackOrder", "N/A"),
             sellable_status=product_data.get("sellableStatus", {}).get(
                 "sellable", "N/A"
@@ -161,24 +260,80 @@ class Scraper:
             apple_pay_enabled=product_data.get("isApplePayEnabled", "N/A"),
         )
 
+    @staticmethod
+    def _parse_with_stores(product_data, store_contents, store_directory=None, lazy=False) -> Product:
+        # Decodes the raw store responses into their SKUs, then parses the product.
+        # Picklable, so it can run in a ParsePool worker (with the worker's directory).
+        for variant, content in zip(product_data["skus"], store_contents):
+            response = None
+            if content is not None:
+                try:
+                    response = decode(content)
+                except DecodeError as e:
+                    logging.error(f"Scrape failed: {e}")
+            variant["store"] = response.get("hits", []) if response else []
+        return Scraper._parse_product(product_data, store_directory, lazy=lazy)
+
+    def _offloads(self, store_contents) -> bool:
+        size = sum(len(content) for content in store_contents if content is not None)
+        return self.parse_pool is not None and self.parse_pool.offloads(size)
+
+    @timed("scrape")
     def scrape_data(self) -> Product:
         data = self._fetch_mobile()
 
-        for variant in data["skus"]:
-            json_data = {
-                "country": "DE",
-                "query": self.city,
-                "clickAndCollect": False,
-                "skuId": variant["skuId"],
-                "pageType": "buypath",
-            }
-            response = self._fetch(
-                url="https://api.louisvuitton.com/eco-eu/search-merch-eapi/v1/deu-de/stores/query",
-                json_data=json_data,
+        def _fetch_stores(variant):
+            return self._fetch(
+                url=self.STORES_URL,
+                json_data=self._get_store_query(variant["skuId"]),
+                raw=True,
             )
-            variant["store"] = response.get("hits", [])
 
-        return self._parse_product(data)
+        # Query the stores for every SKU on the shared pool, at most max_concurrency at a time
+        skus = data["skus"]
+        responses = [None] * len(skus)
+        queued = iter(enumerate(skus))
+        pending = {}
+
+        def _submit_next():
+            for index, variant in queued:
+                pending[submit(_get_store_executor(), _fetch_stores, variant)] = index
+                return
+
+        for _ in range(self.max_concurrency):
+            _submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                responses[pending.pop(future)] = future.result()
+                _submit_next()
+
+        if self._offloads(responses):
+            return self.parse_pool.run(self._parse_with_stores, data, responses)
+        return self._parse_with_stores(data, responses, self.store_directory, lazy=self.lazy)
+
+    @timed("scrape")
+    async def scrape_data_async(self) -> Product:
+        data = await self._fetch_mobile_async()
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _fetch_stores(variant):
+            async with semaphore:
+                return await self._fetch_async(
+                    url=self.STORES_URL,
+                    json_data=self._get_store_query(variant["skuId"]),
+                    raw=True,
+                )
+
+        # Query the stores for every SKU concurrently, bounded by max_concurrency
+        responses = await asyncio.gather(*[
+            _fetch_stores(variant) for variant in data["skus"]
+        ])
+
+        if self._offloads(responses):
+            return await self.parse_pool.run_async(self._parse_with_stores, data, responses)
+        return self._parse_with_stores(data, responses, self.store_directory, lazy=self.lazy)
 
 if __name__ == "__main__":
     scraper = Scraper("M13676")
@@ -0,0 +1,50 @@
+import threading
+import time
+from typing import Optional
+
+
+class StoreDirectory:
+    """
+    Cache of the static part of every store (name, address, geo, hours, image).
+
+    The same stores come back for every SKU and every poll, and only their
+    availability properties change. Parsed static fields are kept per store
+    identifier, so every Store built from them shares the same GeoLocation,
+    Address and WorkingHours objects and strings. Treat those shared objects as
+    read-only. Entries are refreshed after `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float = 24 * 60 * 60):
+        self.ttl = ttl
+        self._entries = {}  # identifier -> (expires_at, static Store fields)
+        self._lock = threading.Lock()
+
+    def get(self, identifier: str) -> Optional[dict]:
+        entry = self._entries.get(identifier)
+        if entry is None:
+            return None
+        expires_at, fields = entry
+        if expires_at < time.monotonic():
+            return None
+        return fields
+
+    def put(self, identifier: str, fields: dict):
+        with self._lock:
+            self._entries[identifier] = (time.monotonic() + self.ttl, fields)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_default_directory = StoreDirectory()
+
+
+def get_default_store_directory() -> StoreDirectory:
+    """
+    Returns the directory shared by all scrapers in this process.
+    """
+    return _default_directory
@@ -0,0 +1,106 @@
+import atexit
+import json
+import logging
+import os
+import threading
+from typing import Optional
+
+
+class ChannelCache:
+    """
+    Remembers which channel a styleColor was last found in, per marketplace.
+
+    With a path the cache is loaded from and written back to a JSON file, so
+    learned channels survive restarts. Changes are written at most every
+    flush_interval seconds, on flush() and at interpreter exit, not on every
+    entry. Without a path it only lives in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None, flush_interval: float = 30):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._entries = {}  # "MARKETPLACE:STYLECOLOR" -> channel ID
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._timer = None
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.error(f"Could not load channel cache {path}: {e}")
+        if path:
+            atexit.register(self.flush)
+
+    @staticmethod
+    def _key(marketplace: str, sku: str) -> str:
+        return f"{marketplace.upper()}:{sku.upper()}"
+
+    def get(self, marketplace: str, sku: str) -> Optional[str]:
+        return self._entries.get(self._key(marketplace, sku))
+
+    def set(self, marketplace: str, sku: str, channel_id: str):
+        key = self._key(marketplace, sku)
+        with self._lock:
+            if self._entries.get(key) == channel_id:
+                return
+            self._entries[key] = channel_id
+            self._mark_dirty()
+
+    def discard(self, marketplace: str, sku: str):
+        with self._lock:
+            if self._entries.pop(self._key(marketplace, sku), None) is not None:
+                self._mark_dirty()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _mark_dirty(self):
+        # Called with the lock held; one timer covers every change until it fires
+        if not self.path:
+            return
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """
+        Writes pending changes to the file now.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty:
+                self._save()
+
+    def _save(self):
+        # Write to a temp file first so a crash never leaves a truncated cache
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False # Stays set after a failure, so the next flush retries
+        except OSError as e:
+            logging.error(f"Could not save channel cache {self.path}: {e}")
+
+
+_default_cache = ChannelCache()
+
+
+def get_default_channel_cache() -> ChannelCache:
+    """
+    Returns the in-memory cache shared by scrapers when none is injected.
+    """
+    return _default_cache
+
+
+def set_default_channel_cache(cache: ChannelCache):
+    """
+    Replaces the shared cache, e.g. with a file-backed ChannelCache(path).
+    """
+    global _default_cache
+    _default_cache = cache
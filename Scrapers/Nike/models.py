@@ -1,23 +1,24 @@
-from dataclasses import dataclass
-from typing import List
-import pytz
+from ..compact import slotted_dataclass
+from typing import TYPE_CHECKING, List
 from datetime import datetime
-from discord import Embed
 
-@dataclass 
+if TYPE_CHECKING:
+    from discord import Embed
+
+@slotted_dataclass
 class Variant:
     pid: str
     group: str
     gtin: str
     size: str
     
-@dataclass
+@slotted_dataclass
 class AvailabilityVariant:
     pid: str
     available: bool
     level: str
 
-@dataclass
+@slotted_dataclass
 class Product:
     name: str
     sku: str
@@ -36,13 +37,15 @@ class Product:
     def __str__(self):
         return f"{self.name} for {self.price} {self.currency} ({self.sku})"
     
-    def to_embed(self) -> Embed:
+    def to_embed(self) -> "Embed":
         """
         Converts the product data into a Discord Embed object.
 
         Returns:
             Embed: A formatted embed containing product details.
         """
+        from discord import Embed
+        import pytz
         
         embed = Embed(
             title=self.name,
@@ -1,6 +1,30 @@
+import asyncio
 import requests
 import logging
-from models import *
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .models import *
+from ..decoding import decode
+from ..compact import intern_str, make_model
+from ..metrics import submit, timed
+from .channel_cache import get_default_channel_cache
+from ..transport import get_default_transport
+from ..async_transport import get_default_async_transport
+
+_probe_executor = None
+_probe_executor_lock = threading.Lock()
+
+
+def _get_probe_executor():
+    # Shared pool for concurrent channel probes of the blocking scrape path
+    global _probe_executor
+    if _probe_executor is None:
+        with _probe_executor_lock:
+            if _probe_executor is None:
+                _probe_executor = ThreadPoolExecutor(
+                    max_workers=32, thread_name_prefix="nike-probe"
+                )
+    return _probe_executor
 
 
 class Scraper:
@@ -12,7 +36,12 @@ class Scraper:
     ]
 
     # Base URL of Nike API
-    BASE_URL = "https://api.nike.com/product_feed/threads/v2"
+    API_URL = "https://api.nike.com"
+    BASE_URL = API_URL + "/product_feed/threads/v2"
+
+    # Batch mode: style colors per filter request and threads per page
+    MAX_BATCH_SKUS = 50
+    PAGE_SIZE = 50
 
     # Region information: language, marketplace code, and currency
     REGIONS = {
@@ -39,78 +68,369 @@ class Scraper:
         "GR": {"language": "el-GR", "marketplace": "GR", "currency": "€"},
     }
 
-    def __init__(self, region, sku):
+    def __init__(self, region, sku, transport=None, async_transport=None, channel_cache=None, lazy=False):
         self.region = region.upper()
         self.sku = sku
+        self.transport = transport or get_default_transport()
+        self.async_transport = async_transport or get_default_async_transport()
+        self.channel_cache = channel_cache if channel_cache is not None else get_default_channel_cache()
+        self.lazy = lazy  # Build variants only when first accessed
+
+    @staticmethod
+    def _get_headers():
+        return {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36"
+        }
+
+    @classmethod
+    def _build_filters(cls, region, skus):
+        return f"filter=language({cls.REGIONS[region]['language']})&filter=marketplace({cls.REGIONS[region]['marketplace']})&filter=productInfo.merchProduct.styleColor({','.join(skus)})"
+
+    def _get_filters(self):
+        return self._build_filters(self.region, [self.sku])
+
+    def _get_channel_url(self, channel_id):
+        return f"{self.BASE_URL}?{self._get_filters()}&filter=channelId({channel_id})"
+
+    def _get_marketplace(self):
+        return self.REGIONS[self.region]["marketplace"]
+
+    def _fetch_channel(self, channel_id):
+        """
+        Queries a single channel.
+
+        Returns:
+            dict: JSON response if the channel lists the product, else None.
+        """
+        response = self.transport.get(
+            url=self._get_channel_url(channel_id), headers=self._get_headers()
+        )
+        response.raise_for_status()
+        data = decode(response.content)
+        if data["pages"]["totalResources"] > 0:
+            return data
+        return None
+
+    async def _fetch_channel_async(self, channel_id):
+        response = await self.async_transport.get(
+            url=self._get_channel_url(channel_id), headers=self._get_headers()
+        )
+        response.raise_for_status()
+        data = decode(response.content)
+        if data["pages"]["totalResources"] > 0:
+            return data
+        return None
+
+    def _probe_channels(self, channel_ids):
+        """
+        Queries all channels concurrently and returns the first hit.
+
+        Returns:
+            tuple: (data, channel_id), or (None, None) if no channel lists the product.
+        """
+        futures = {
+            submit(_get_probe_executor(), self._fetch_channel, channel_id): channel_id
+            for channel_id in channel_ids
+        }
+        errors = []
+        try:
+            for future in as_completed(futures):
+                try:
+                    data = future.result()
+                except requests.exceptions.RequestException as e:
+                    errors.append(e)
+                    continue
+                if data is not None:
+                    return data, futures[future]
+        finally:
+            for future in futures:
+                future.cancel()
+        if len(errors) == len(futures):
+            raise errors[0]
+        return None, None
+
+    async def _probe_channels_async(self, channel_ids):
+        tasks = {
+            asyncio.ensure_future(self._fetch_channel_async(channel_id)): channel_id
+            for channel_id in channel_ids
+        }
+        errors = []
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        data = task.result()
+                    except requests.exceptions.RequestException as e:
+                        errors.append(e)
+                        continue
+                    if data is not None:
+                        return data, tasks[task]
+        finally:
+            for task in tasks:
+                task.cancel()
+        if len(errors) == len(tasks):
+            raise errors[0]
+        return None, None
 
     def _fetch(self):
         """
         Sends a GET request to fetch data from the API.
-        
+
+        The channel the product was last found in is tried first. On a miss
+        all channels are probed concurrently and the hit is remembered.
+
         Returns:
             dict: JSON response from the API if successful, else None.
         """
+        marketplace = self._get_marketplace()
         try:
-            header = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36"
-            }
-            filters = f"filter=language({self.REGIONS[self.region]['language']})&filter=marketplace({self.REGIONS[self.region]['marketplace']})&filter=productInfo.merchProduct.styleColor({self.sku})"
-            for channel_id in self.CHANNEL_IDS:
-                url = f"{self.BASE_URL}?{filters}&filter=channelId({channel_id})"
-                response = requests.get(url=url, headers=header)
-                response.raise_for_status()
-                data = response.json()
-                if data["pages"]["totalResources"] > 0:
+            cached_channel = self.channel_cache.get(marketplace, self.sku)
+            if cached_channel:
+                data = self._fetch_channel(cached_channel)
+                if data is not None:
                     return data
-            else:
-                raise Exception("No resources found for any channel ID")
+                self.channel_cache.discard(marketplace, self.sku)
+
+            data, channel_id = self._probe_channels(
+                [c for c in self.CHANNEL_IDS if c != cached_channel]
+            )
+            if data is None:
+                logging.error(f"No resources found for any channel ID ({self.sku})")
+                return None
+            self.channel_cache.set(marketplace, self.sku, channel_id)
+            return data
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
+
+    async def _fetch_async(self):
+        """
+        Non-blocking variant of _fetch using the async transport.
+
+        Returns:
+            dict: JSON response from the API if successful, else None.
+        """
+        marketplace = self._get_marketplace()
+        try:
+            cached_channel = self.channel_cache.get(marketplace, self.sku)
+            if cached_channel:
+                data = await self._fetch_channel_async(cached_channel)
+                if data is not None:
+                    return data
+                self.channel_cache.discard(marketplace, self.sku)
+
+            data, channel_id = await self._probe_channels_async(
+                [c for c in self.CHANNEL_IDS if c != cached_channel]
+            )
+            if data is None:
+                logging.error(f"No resources found for any channel ID ({self.sku})")
+                return None
+            self.channel_cache.set(marketplace, self.sku, channel_id)
+            return data
         except requests.exceptions.RequestException as e:
             logging.error(f"Scrape failed: {e}")
             return None
 
     @staticmethod
-    def _parse_response(response_data):
+    @timed("parse")
+    def _parse_response(response_data, lazy=False):
         def _parse_variants(variants_data):
             return Variant(
                 pid=variants_data["id"],
-                group=variants_data["merchGroup"],
+                group=intern_str(variants_data["merchGroup"]),
                 gtin=variants_data["gtin"],
-                size=variants_data["nikeSize"],
+                size=intern_str(variants_data["nikeSize"]),
             )
 
         def _parse_availability_variants(variants_data):
             return AvailabilityVariant(
                 pid=variants_data["id"],
                 available=variants_data["available"],
-                level=variants_data["level"],
+                level=intern_str(variants_data["level"]),
             )
 
         product_info = response_data["objects"][0]["productInfo"][0]
-        return Product(
+        return make_model(
+            Product,
+            lazy,
+            deferred={
+                "availability_variants": lambda: [
+                    _parse_availability_variants(av) for av in product_info["availableSkus"]
+                ],
+                "variants": lambda: [_parse_variants(v) for v in product_info["skus"]],
+            },
             name=product_info["merchProduct"]["labelName"],
             sku=product_info["merchProduct"]["styleColor"],
             price=product_info["merchPrice"]["currentPrice"],
             discounted=product_info["merchPrice"]["discounted"],
-            currency=product_info["merchPrice"]["currency"],
-            channels=product_info["merchProduct"]["channels"],
-            genders=product_info["merchProduct"]["genders"],
+            currency=intern_str(product_info["merchPrice"]["currency"]),
+            channels=[intern_str(c) for c in product_info["merchProduct"]["channels"]],
+            genders=[intern_str(g) for g in product_info["merchProduct"]["genders"]],
             quantity_limit=product_info["merchProduct"]["quantityLimit"],
-            publish_type=product_info["merchProduct"]["publishType"],
+            publish_type=intern_str(product_info["merchProduct"]["publishType"]),
             exclusive_access=product_info["merchProduct"]["exclusiveAccess"],
             commerce_start_date=product_info["merchProduct"]["commerceStartDate"],
-            availability_variants=[
-                _parse_availability_variants(av) for av in product_info["availableSkus"]
-            ],
-            variants=[_parse_variants(v) for v in product_info["skus"]],
         )
 
+    @classmethod
+    def _get_batch_url(cls, region, skus, channel_id):
+        return f"{cls.BASE_URL}?{cls._build_filters(region, skus)}&filter=channelId({channel_id})&count={cls.PAGE_SIZE}"
+
+    @classmethod
+    def _plan_batch(cls, skus, marketplace, channel_cache):
+        """
+        Groups SKUs into (channel_id, skus) requests.
+
+        SKUs with a cached channel are queried there first. Everything still
+        missing afterwards is queried in every channel in CHANNEL_IDS order,
+        except the cached channel it already missed in.
+        """
+        by_channel = {}
+        for sku in skus:
+            channel_id = channel_cache.get(marketplace, sku)
+            if channel_id:
+                by_channel.setdefault(channel_id, []).append(sku)
+        for channel_id, channel_skus in by_channel.items():
+            for i in range(0, len(channel_skus), cls.MAX_BATCH_SKUS):
+                yield channel_id, channel_skus[i : i + cls.MAX_BATCH_SKUS]
+        yield from ((channel_id, None) for channel_id in cls.CHANNEL_IDS)
+
+    @staticmethod
+    def _split_objects(data, wanted):
+        """
+        Splits a multi-SKU threads response into single-SKU responses.
+
+        Returns:
+            dict: Upper-case styleColor -> response shaped like a single-SKU lookup.
+        """
+        found = {}
+        for thread in data.get("objects", []):
+            for product_info in thread.get("productInfo", []):
+                sku = product_info["merchProduct"]["styleColor"].upper()
+                if sku in wanted and sku not in found:
+                    found[sku] = {
+                        "pages": {"totalResources": 1},
+                        "objects": [{**thread, "productInfo": [product_info]}],
+                    }
+        return found
+
+    @staticmethod
+    def _forget_misses(chunk, remaining, missed, marketplace, channel_id, channel_cache):
+        # SKUs not found in their cached channel: drop the entry and skip that channel later
+        for sku in chunk:
+            if sku in remaining:
+                missed[sku] = channel_id
+                channel_cache.discard(marketplace, sku)
+
+    @classmethod
+    @timed("batch")
+    def scrape_batch(cls, region, skus, transport=None, channel_cache=None, lazy=False):
+        """
+        Looks up many style colors with one filter request per channel and chunk.
+
+        Returns:
+            dict: Requested SKU -> Product, or None if no channel lists it.
+        """
+        region = region.upper()
+        transport = transport or get_default_transport()
+        channel_cache = channel_cache if channel_cache is not None else get_default_channel_cache()
+        marketplace = cls.REGIONS[region]["marketplace"]
+        results = {sku.upper(): None for sku in skus} # Nike and ChannelCache key style colors upper-case
+        remaining = set(results)
+        missed = {} # SKU -> cached channel it wasn't found in
+
+        for channel_id, planned in cls._plan_batch(list(results), marketplace, channel_cache):
+            pending = [
+                s for s in (planned or results) if s in remaining and missed.get(s) != channel_id
+            ]
+            for i in range(0, len(pending), cls.MAX_BATCH_SKUS):
+                chunk = pending[i : i + cls.MAX_BATCH_SKUS]
+                url = cls._get_batch_url(region, chunk, channel_id)
+                try:
+                    # Follow pages.next until the channel has no more threads
+                    while url:
+                        response = transport.get(url=url, headers=cls._get_headers())
+                        response.raise_for_status()
+                        data = decode(response.content)
+                        for sku, sku_data in cls._split_objects(data, remaining).items():
+                            results[sku] = cls._parse_response(sku_data, lazy)
+                            remaining.discard(sku)
+                            channel_cache.set(marketplace, sku, channel_id)
+                        next_page = data.get("pages", {}).get("next")
+                        url = cls.API_URL + next_page if next_page else None
+                except requests.exceptions.RequestException as e:
+                    logging.error(f"Batch scrape failed: {e}")
+                else:
+                    if planned is not None:
+                        cls._forget_misses(chunk, remaining, missed, marketplace, channel_id, channel_cache)
+            if not remaining:
+                break
+        return {sku: results[sku.upper()] for sku in skus}
+
+    @classmethod
+    @timed("batch")
+    async def scrape_batch_async(cls, region, skus, async_transport=None, channel_cache=None, lazy=False):
+        """
+        Non-blocking variant of scrape_batch; chunks of one channel run concurrently.
+        """
+        region = region.upper()
+        async_transport = async_transport or get_default_async_transport()
+        channel_cache = channel_cache if channel_cache is not None else get_default_channel_cache()
+        marketplace = cls.REGIONS[region]["marketplace"]
+        results = {sku.upper(): None for sku in skus}
+        remaining = set(results)
+        missed = {}
+
+        async def _fetch_chunk(channel_id, chunk, cached):
+            url = cls._get_batch_url(region, chunk, channel_id)
+            try:
+                while url:
+                    response = await async_transport.get(url=url, headers=cls._get_headers())
+                    response.raise_for_status()
+                    data = decode(response.content)
+                    for sku, sku_data in cls._split_objects(data, remaining).items():
+                        results[sku] = cls._parse_response(sku_data, lazy)
+                        remaining.discard(sku)
+                        channel_cache.set(marketplace, sku, channel_id)
+                    next_page = data.get("pages", {}).get("next")
+                    url = cls.API_URL + next_page if next_page else None
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Batch scrape failed: {e}")
+            else:
+                if cached:
+                    cls._forget_misses(chunk, remaining, missed, marketplace, channel_id, channel_cache)
+
+        for channel_id, planned in cls._plan_batch(list(results), marketplace, channel_cache):
+            pending = [
+                s for s in (planned or results) if s in remaining and missed.get(s) != channel_id
+            ]
+            await asyncio.gather(*[
+                _fetch_chunk(channel_id, pending[i : i + cls.MAX_BATCH_SKUS], planned is not None)
+                for i in range(0, len(pending), cls.MAX_BATCH_SKUS)
+            ])
+            if not remaining:
+                break
+        return {sku: results[sku.upper()] for sku in skus}
+
+    @timed("scrape")
     def scrape_data(self):
         data = self._fetch()
         if data is None:
             return None
-        parsed_data = self._parse_response(data)
+        parsed_data = self._parse_response(data, lazy=self.lazy)
         return parsed_data
 
+    @timed("scrape")
+    async def scrape_data_async(self):
+        data = await self._fetch_async()
+        if data is None:
+            return None
+        return self._parse_response(data, lazy=self.lazy)
+
 
 if __name__ == "__main__":
     scraper = Scraper("de", "CW2288-111")
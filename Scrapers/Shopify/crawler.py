@@ -0,0 +1,278 @@
+import asyncio
+import inspect
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from .scraper import Scraper
+
+
+def _domain(store: str) -> str:
+    # Accepts "shop.com", "https://shop.com" or any URL of the store
+    return (urlsplit(store).netloc or urlsplit("//" + store).netloc).lower()
+
+
+class SyncState:
+    """
+    Last seen updated_at of every product, per store domain.
+
+    With a path the state is loaded from and written back to a JSON file, so
+    a restarted crawler only emits what changed in the meantime. The file is
+    only rewritten when something changed since the last save. Without a
+    path it only lives in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._domains: Dict[str, Dict[int, str]] = {} # domain -> product ID -> updated_at
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._domains = {
+                        domain: {int(pid): updated for pid, updated in products.items()}
+                        for domain, products in json.load(f).items()
+                    }
+            except (OSError, ValueError) as e:
+                logging.error(f"Could not load sync state {path}: {e}")
+
+    def get(self, domain: str, product_id: int) -> Optional[str]:
+        products = self._domains.get(domain)
+        return products.get(product_id) if products else None
+
+    def update(self, domain: str, updates: Dict[int, str]):
+        if updates:
+            self._domains.setdefault(domain, {}).update(updates)
+            self._dirty = True
+
+    def prune(self, domain: str, seen):
+        # Forget products that are no longer listed
+        products = self._domains.get(domain)
+        if products:
+            for product_id in products.keys() - seen:
+                del products[product_id]
+                self._dirty = True
+
+    def __len__(self):
+        return sum(len(products) for products in self._domains.values())
+
+    def _snapshot(self):
+        # Copy taken on the event loop, so the write can run in a thread
+        if not self.path or not self._dirty:
+            return None
+        self._dirty = False
+        return {domain: dict(products) for domain, products in self._domains.items()}
+
+    def _write(self, domains):
+        # Write to a temp file first so a crash never leaves a truncated state
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(domains, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.error(f"Could not save sync state {self.path}: {e}")
+            self._dirty = True # Retried on the next save
+
+    def save(self):
+        """
+        Writes the state to its file if it changed since the last save.
+        """
+        domains = self._snapshot()
+        if domains is not None:
+            self._write(domains)
+
+    async def save_async(self):
+        """
+        Non-blocking variant of save(); the file is written in a thread.
+        """
+        domains = self._snapshot()
+        if domains is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, domains)
+
+
+class _RateLimiter:
+    # Spaces calls at least 1 / rate seconds apart (single event loop, no lock needed)
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate else 0
+        self._next = 0.0
+
+    async def wait(self):
+        now = time.monotonic()
+        at = max(now, self._next)
+        self._next = at + self.interval
+        if at > now:
+            await asyncio.sleep(at - now)
+
+
+class CatalogCrawler:
+    """
+    Incremental catalog sync across many Shopify stores.
+
+    Every sweep walks each store's /products.json, but only parses and emits
+    products whose updated_at moved since they were last seen, so a sweep
+    costs the page requests plus the changes. Up to max_stores stores sync
+    at once. Within a store, up to domain_concurrency pages are requested
+    together and requests are spaced to at most domain_rate per second. A
+    store whose sync failed resumes from the failed page on the next sweep.
+    The sync state is saved once per sweep, and only if it changed.
+    """
+
+    def __init__(
+        self,
+        stores: Iterable[str] = (), # Store domains or URLs
+        on_product: Optional[Callable] = None, # Called with (domain, product) for new/updated products
+        state: Optional[SyncState] = None,
+        max_stores: int = 32, # Stores synced concurrently
+        domain_concurrency: int = 1, # Pages in flight per store
+        domain_rate: float = 2.0, # Max page requests per second per store (0 = unlimited)
+        page_size: int = Scraper.MAX_PAGE_SIZE,
+        async_transport=None,
+    ):
+        self.on_product = on_product
+        self.state = state if state is not None else SyncState()
+        self.max_stores = max_stores
+        self.domain_concurrency = max(1, domain_concurrency)
+        self.domain_rate = domain_rate
+        self.page_size = min(page_size, Scraper.MAX_PAGE_SIZE)
+        self.async_transport = async_transport
+
+        self._scrapers: Dict[str, Scraper] = {}
+        self._limiters: Dict[str, _RateLimiter] = {}
+        self._cursors: Dict[str, int] = {} # domain -> page to resume from
+        self._wakeup = None
+        self._running = False
+
+        for store in stores:
+            self.add(store)
+
+    def add(self, store: str):
+        domain = _domain(store)
+        if domain not in self._scrapers:
+            self._scrapers[domain] = Scraper(f"https://{domain}", async_transport=self.async_transport)
+            self._limiters[domain] = _RateLimiter(self.domain_rate)
+
+    def remove(self, store: str):
+        domain = _domain(store)
+        self._scrapers.pop(domain, None)
+        self._limiters.pop(domain, None)
+        self._cursors.pop(domain, None)
+
+    def __len__(self):
+        return len(self._scrapers)
+
+    @staticmethod
+    async def _call(callback, *args):
+        if callback is None:
+            return
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            await result
+
+    async def _fetch_page(self, domain: str, page: int):
+        scraper = self._scrapers[domain]
+        await self._limiters[domain].wait()
+        return await scraper._fetch_async(scraper._get_catalog_url(page, self.page_size))
+
+    async def sync(self, store: str) -> int:
+        """
+        Syncs one store, saves the state and returns the number of products emitted.
+        """
+        try:
+            return await self._sync(store)
+        finally:
+            await self.state.save_async()
+
+    async def _sync(self, store: str) -> int:
+        domain = _domain(store)
+        self.add(domain)
+        scraper = self._scrapers[domain]
+        page = self._cursors.pop(domain, 1)
+        seen = set() if page == 1 else None # Only a sweep from the first page can prune
+        emitted = 0
+
+        while page is not None:
+            pages = range(page, page + self.domain_concurrency)
+            results = await asyncio.gather(*[self._fetch_page(domain, number) for number in pages])
+            for number, data in zip(pages, results):
+                if data is None:
+                    self._cursors[domain] = number
+                    return emitted
+
+                updates = {}
+
+                def _select(entry):
+                    # Skip (without parsing) entries whose updated_at did not move
+                    product_id = entry["id"]
+                    updated_at = entry.get("updated_at")
+                    if seen is not None:
+                        seen.add(product_id)
+                    if updated_at is not None and self.state.get(domain, product_id) == updated_at:
+                        return False
+                    updates[product_id] = updated_at
+                    return True
+
+                products, page = scraper._parse_catalog_page(data, number, self.page_size, _select)
+                del data
+                for product in products:
+                    await self._call(self.on_product, domain, product)
+                emitted += len(products)
+                # Recorded only once emitted, so a failed callback is retried next sweep
+                self.state.update(domain, updates)
+                if page is None:
+                    break
+
+        if seen is not None:
+            self.state.prune(domain, seen)
+        return emitted
+
+    async def sweep(self) -> Dict[str, int]:
+        """
+        Syncs every store once.
+
+        Returns:
+            dict: Domain -> products emitted (None if the sync raised).
+        """
+        slots = asyncio.Semaphore(self.max_stores)
+
+        async def _sync(domain):
+            async with slots:
+                try:
+                    return await self._sync(domain)
+                except Exception as e:
+                    logging.error(f"Catalog sync failed for {domain}: {e}")
+                    return None
+
+        domains = list(self._scrapers)
+        try:
+            return dict(zip(domains, await asyncio.gather(*[_sync(d) for d in domains])))
+        finally:
+            await self.state.save_async()
+
+    async def run(self, interval: float = 600):
+        """
+        Sweeps all stores every `interval` seconds until stop() is called.
+        """
+        self._wakeup = asyncio.Event()
+        self._running = True
+        try:
+            while self._running:
+                start = time.monotonic()
+                await self.sweep()
+                delay = interval - (time.monotonic() - start)
+                if delay > 0 and self._running:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            self._running = False
+
+    def stop(self):
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
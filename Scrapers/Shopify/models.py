@@ -1,14 +1,16 @@
-from dataclasses import dataclass
-from typing import Optional, List
-from discord import Embed
+from ..compact import slotted_dataclass
+from typing import TYPE_CHECKING, Optional, List
 
-@dataclass
+if TYPE_CHECKING:
+    from discord import Embed
+
+@slotted_dataclass
 class QuantityRule:
     min: int # Min cart quantity
     max: Optional[int] # Max cart quantity
     increment: int
 
-@dataclass
+@slotted_dataclass
 class Variant:
     id: int
     title: str
@@ -23,14 +25,14 @@ class Variant:
     quantity_rule: QuantityRule
     price_currency: str
 
-@dataclass
+@slotted_dataclass
 class Option:
     id: int
     name: str
     position: int
     values: List[str]
     
-@dataclass
+@slotted_dataclass
 class Image: 
     id: int
     position: int
@@ -42,7 +44,7 @@ class Image:
     src: str
     variant_ids: List[int]
 
-@dataclass
+@slotted_dataclass
 class Product:
     id: int
     title: str
@@ -58,13 +60,15 @@ class Product:
     def __str__(self):
         return f"{self.title} by {self.vendor} ({self.product_type})"
     
-    def to_embed(self) -> Embed:
+    def to_embed(self) -> "Embed":
         """
         Converts the product data into a Discord Embed object.
 
         Returns:
             Embed: A formatted embed containing product details.
         """
+        from discord import Embed
+
         
         embed = Embed(
             title=self.title,
@@ -1,27 +1,48 @@
 import requests
 import logging
-from models import *
+from urllib.parse import urlsplit
+from .models import *
+from ..decoding import decode
+from ..compact import intern_str, make_model
+from ..metrics import timed
+from ..transport import get_default_transport
+from ..async_transport import get_default_async_transport
 
 
 class Scraper:
+    MAX_PAGE_SIZE = 250 # Largest page /products.json returns
 
-    def __init__(self, url):
-        self.base_url = url
+    def __init__(self, url, transport=None, async_transport=None, lazy=False):
+        self.base_url = url # Product URL, or just the store URL for the catalog
+        self.transport = transport or get_default_transport()
+        self.async_transport = async_transport or get_default_async_transport()
+        self.lazy = lazy  # Build images/options/variants only when first accessed
+        self.catalog_cursor = None  # Next /products.json page of iter_catalog (None once finished)
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
         }
 
     def _fetch(self, url):
         try:
-            response = requests.get(url=url, headers=self.headers, timeout=10)
+            response = self.transport.get(url=url, headers=self.headers, timeout=10)
             response.raise_for_status()  # Wirft Fehler wenn Status != 200
-            return response.json()  # Gibt JSON-Antwort zurück
+            return decode(response.content)  # Gibt JSON-Antwort zurück
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
+
+    async def _fetch_async(self, url):
+        try:
+            response = await self.async_transport.get(url=url, headers=self.headers, timeout=10)
+            response.raise_for_status()
+            return decode(response.content)
         except requests.exceptions.RequestException as e:
             logging.error(f"Scrape failed: {e}")
             return None
 
     @staticmethod
-    def _parse_response(product_data):
+    @timed("parse")
+    def _parse_response(product_data, lazy=False):
 
         # Bilder in richtige Objekte packen
         def _parse_image(img):
@@ -41,9 +62,9 @@ class Scraper:
         def _parse_option(opt):
             return Option(
                 id=opt["id"],
-                name=opt["name"],
+                name=intern_str(opt["name"]),
                 position=opt["position"],
-                values=opt["values"],
+                values=[intern_str(v) for v in opt["values"]],
             )
 
         # Parse quantity rule data
@@ -56,41 +77,140 @@ class Scraper:
         def _parse_variant(var):
             return Variant(
                 id=var["id"],
-                title=var["title"],
-                price=var["price"],
+                title=intern_str(var["title"]),
+                price=intern_str(var["price"]),
                 sku=var["sku"],
                 position=var["position"],
                 barcode=var["barcode"],
                 weight=var["weight"],
-                weight_unit=var["weight_unit"],
+                weight_unit=intern_str(var["weight_unit"]),
                 taxable=var["taxable"],
                 requires_shipping=var["requires_shipping"],
                 quantity_rule=_parse_quantity_rule(var["quantity_rule"]),
-                price_currency=var["price_currency"],
+                price_currency=intern_str(var["price_currency"]),
             )
 
         # Extract and map product fields
         product = product_data["product"]
-        return Product(
+        return make_model(
+            Product,
+            lazy,
+            deferred={
+                "image": lambda: _parse_image(product["image"]) if product.get("image") else None,
+                "options": lambda: [_parse_option(o) for o in product["options"]],
+                "images": lambda: [_parse_image(i) for i in product["images"]],
+                "variants": lambda: [_parse_variant(v) for v in product["variants"]],
+            },
             id=product["id"],
             title=product["title"],
-            vendor=product["vendor"],
-            product_type=product["product_type"],
+            vendor=intern_str(product["vendor"]),
+            product_type=intern_str(product["product_type"]),
             handle=product["handle"],
             tags=product["tags"],
-            image=_parse_image(product["image"]),
-            options=[_parse_option(o) for o in product["options"]],
-            images=[_parse_image(i) for i in product["images"]],
-            variants=[_parse_variant(v) for v in product["variants"]],
         )
 
+    @staticmethod
+    def _normalize_catalog_product(product):
+        # /products.json lists a shorter shape than <handle>.json; fill in what Product needs
+        images = product.get("images") or []
+        tags = product.get("tags", "")
+        return {
+            **product,
+            "image": product.get("image") or (images[0] if images else None),
+            "tags": ", ".join(tags) if isinstance(tags, list) else tags,
+            "variants": [
+                {
+                    **variant,
+                    "barcode": variant.get("barcode"),
+                    "weight": variant.get("weight", variant.get("grams")),
+                    "weight_unit": variant.get("weight_unit", "g"),
+                    "quantity_rule": variant.get("quantity_rule") or {"min": 1, "max": None, "increment": 1},
+                    "price_currency": variant.get("price_currency"),
+                }
+                for variant in product.get("variants", [])
+            ],
+        }
+
+    def _get_catalog_url(self, page, page_size):
+        parts = urlsplit(self.base_url)
+        return f"{parts.scheme or 'https'}://{parts.netloc}/products.json?limit={page_size}&page={page}"
+
+    def _parse_catalog_page(self, data, page, page_size, select=None):
+        # Returns the page's products and the next page (None after the last one)
+        products = data.get("products") or []
+        next_page = page + 1 if len(products) >= page_size else None
+        # Always eager, so no product keeps the page's dicts alive
+        return [
+            self._parse_response({"product": self._normalize_catalog_product(p)})
+            for p in products
+            if select is None or select(p)
+        ], next_page
+
+    def iter_catalog(self, cursor=None, page_size=MAX_PAGE_SIZE, select=None):
+        """
+        Streams every product of the store from the paginated /products.json.
+
+        Only one page is held in memory at a time. self.catalog_cursor is the
+        page to resume from and None once the last page was read. If a page
+        fails, iteration stops with the cursor on that page, so
+        iter_catalog(scraper.catalog_cursor) continues where it stopped.
+        Products of a partly consumed page are yielded again on resume.
+
+        Args:
+            cursor: Page to start from (default 1, the first page).
+            page_size: Products per page, at most MAX_PAGE_SIZE.
+            select: Optional function called with every raw listing entry;
+                entries it returns False for are skipped without parsing.
+
+        Yields:
+            Product: One per catalog entry.
+        """
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+        page = cursor or 1
+        while page is not None:
+            self.catalog_cursor = page # Stays here until the page is consumed
+            data = self._fetch(self._get_catalog_url(page, page_size))
+            if data is None:
+                return
+            products, page = self._parse_catalog_page(data, page, page_size, select)
+            del data
+            yield from products
+            del products
+        self.catalog_cursor = None
+
+    async def iter_catalog_async(self, cursor=None, page_size=MAX_PAGE_SIZE, select=None):
+        """
+        Non-blocking variant of iter_catalog (an async generator).
+        """
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+        page = cursor or 1
+        while page is not None:
+            self.catalog_cursor = page
+            data = await self._fetch_async(self._get_catalog_url(page, page_size))
+            if data is None:
+                return
+            products, page = self._parse_catalog_page(data, page, page_size, select)
+            del data
+            for product in products:
+                yield product
+            del products
+        self.catalog_cursor = None
+
+    @timed("scrape")
     def scrape_data(self):
         data = self._fetch(self.base_url + ".json")  # Fetch JSON from URL
         if data is None:
             return None
-        parsed_data = self._parse_response(data)  # Convert to Product object
+        parsed_data = self._parse_response(data, lazy=self.lazy)  # Convert to Product object
         return parsed_data
 
+    @timed("scrape")
+    async def scrape_data_async(self):
+        data = await self._fetch_async(self.base_url + ".json")
+        if data is None:
+            return None
+        return self._parse_response(data, lazy=self.lazy)
+
 
 if __name__ == "__main__":
     scraper = Scraper(
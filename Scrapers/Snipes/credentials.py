@@ -0,0 +1,319 @@
+import asyncio
+import ipaddress
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from typing import Callable, Optional, Tuple, Union
+
+import requests
+
+from ..compact import slotted_dataclass
+
+try:
+    import fcntl
+except ImportError: # Windows: FileProvider refreshes are single-flight per process only
+    fcntl = None
+
+Address = Union[str, Tuple[str, int]] # Unix socket path or (host, port)
+
+
+class CredentialError(requests.exceptions.RequestException):
+    """Raised when no usable token could be obtained."""
+
+
+@slotted_dataclass
+class Token:
+    value: str
+    expires_at: Optional[float] = None # Unix time; None if unknown
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.expires_at is not None and self.expires_at - seconds <= time.time()
+
+
+class CredentialProvider:
+    """
+    Source of Snipes bearer tokens. Subclasses implement fetch().
+    """
+
+    def fetch(self, stale: Optional[Token] = None) -> Token:
+        """
+        Returns a usable token other than stale.
+
+        stale is the caller's current token, which has expired, is about to
+        expire, or was rejected by the API.
+        """
+        raise NotImplementedError
+
+
+class StaticProvider(CredentialProvider):
+    """Always returns the same token (e.g. one pasted from the browser)."""
+
+    def __init__(self, token: str):
+        self.token = Token(token)
+
+    def fetch(self, stale=None):
+        return self.token
+
+
+class FileProvider(CredentialProvider):
+    """
+    Shares tokens between processes through a JSON file.
+
+    Every process reads the newest token from the file. When it is missing,
+    expiring or equal to the stale one, the first process to take the
+    file lock calls refresh() and writes the result; processes waiting on
+    the lock then read that token instead of refreshing again. Without
+    refresh the file is expected to be kept current by something else.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        refresh: Optional[Callable[[], Token]] = None, # Obtains a new token, e.g. by logging in
+        refresh_ahead: float = 60, # Seconds before expiry a token counts as expiring
+    ):
+        self.path = path
+        self.refresh = refresh
+        self.refresh_ahead = refresh_ahead
+        self._lock = threading.Lock()
+
+    def _read(self) -> Optional[Token]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return Token(data["token"], data.get("expires_at"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.error(f"Could not read credentials {self.path}: {e}")
+            return None
+
+    def _write(self, token: Token):
+        # Write to a temp file first so readers never see a truncated token
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"token": token.value, "expires_at": token.expires_at}, f)
+        os.replace(tmp_path, self.path)
+
+    def _usable(self, token, stale) -> bool:
+        if token is None or token.expires_within(self.refresh_ahead):
+            return False
+        return stale is None or token.value != stale.value
+
+    def fetch(self, stale=None):
+        token = self._read()
+        if self._usable(token, stale):
+            return token
+        if self.refresh is None:
+            if token is None:
+                raise CredentialError(f"No token in {self.path}")
+            return token
+        with self._lock, open(f"{self.path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                token = self._read() # Another process may have refreshed meanwhile
+                if self._usable(token, stale):
+                    return token
+                token = self.refresh()
+                self._write(token)
+                return token
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _connect(address: Address, timeout: float) -> socket.socket:
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(address)
+        return sock
+    return socket.create_connection(address, timeout=timeout)
+
+
+class SocketProvider(CredentialProvider):
+    """
+    Gets tokens from a serve_credentials() server shared by all workers.
+
+    The server keeps one CredentialCache, so however many processes ask,
+    each token is refreshed once.
+    """
+
+    def __init__(self, address: Address, timeout: float = 10):
+        self.address = address
+        self.timeout = timeout
+
+    def fetch(self, stale=None):
+        request = {"stale": stale.value if stale is not None else None}
+        try:
+            with _connect(self.address, self.timeout) as sock:
+                sock.sendall(json.dumps(request).encode() + b"\n")
+                with sock.makefile("rb") as f:
+                    data = json.loads(f.readline())
+        except (OSError, ValueError) as e:
+            raise CredentialError(f"Credential server {self.address} failed: {e}") from e
+        if data.get("error"):
+            raise CredentialError(data["error"])
+        return Token(data["token"], data.get("expires_at"))
+
+
+class CredentialCache:
+    """
+    Caches the current token of a provider and refreshes it single-flight.
+
+    Once a token is within refresh_ahead seconds of expiry, one caller
+    refreshes it while all others keep using the still valid token, so
+    requests never wait on a refresh before expiry. A token rejected by
+    the API is reported with rejected(); concurrent reports of the same
+    token cause a single refresh. After a failed refresh the provider is
+    left alone for failure_backoff seconds.
+    """
+
+    def __init__(self, provider: CredentialProvider, refresh_ahead: float = 60, failure_backoff: float = 5):
+        self.provider = provider
+        self.refresh_ahead = refresh_ahead
+        self.failure_backoff = failure_backoff
+        self._token: Optional[Token] = None
+        self._backoff_until = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fallback(stale: Optional[Token], message: str) -> Token:
+        # Keep serving the old token until it actually expires
+        if stale is not None and not stale.expires_within(0):
+            return stale
+        raise CredentialError(message)
+
+    def _refresh(self, stale: Optional[Token]) -> Token:
+        if time.monotonic() < self._backoff_until:
+            return self._fallback(stale, "Token refresh failed recently")
+        try:
+            token = self.provider.fetch(stale)
+        except Exception as e:
+            logging.error(f"Token refresh failed: {e}")
+            self._backoff_until = time.monotonic() + self.failure_backoff
+            return self._fallback(stale, f"Token refresh failed: {e}")
+        self._backoff_until = 0.0
+        self._token = token
+        return token
+
+    def token(self) -> Token:
+        token = self._token
+        if token is not None and not token.expires_within(self.refresh_ahead):
+            return token
+        if token is not None and not token.expires_within(0):
+            # Expiring soon: one caller refreshes, the others don't wait
+            if not self._lock.acquire(blocking=False):
+                return token
+            try:
+                return self._refresh(token) if self._token is token else self._token
+            finally:
+                self._lock.release()
+        with self._lock:
+            if self._token is not token:
+                return self._token # Refreshed while we waited
+            return self._refresh(token)
+
+    def get(self) -> str:
+        return self.token().value
+
+    def _rejected(self, value: str) -> Token:
+        with self._lock:
+            current = self._token
+            if current is not None and current.value != value:
+                return current # Already replaced by another caller
+            return self._refresh(current or Token(value))
+
+    def rejected(self, value: str) -> str:
+        """
+        Reports a token the API rejected and returns the token to retry with.
+
+        The returned token equals value if no other token could be obtained.
+        """
+        return self._rejected(value).value
+
+    def _needs_refresh(self) -> bool:
+        return self._token is None or self._token.expires_within(self.refresh_ahead)
+
+    async def get_async(self) -> str:
+        if not self._needs_refresh():
+            return self._token.value
+        # Providers block (file or socket I/O), so refresh in a thread
+        return await asyncio.get_running_loop().run_in_executor(None, self.get)
+
+    async def rejected_async(self, value: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(None, self.rejected, value)
+
+
+class _CredentialHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        cache = self.server.cache
+        try:
+            stale = json.loads(self.rfile.readline() or b"{}").get("stale")
+            token = cache._rejected(stale) if stale else cache.token()
+            reply = {"token": token.value, "expires_at": token.expires_at}
+        except (ValueError, AttributeError) as e:
+            reply = {"error": f"Bad request: {e}"}
+        except requests.exceptions.RequestException as e:
+            reply = {"error": str(e)}
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def serve_credentials(cache: CredentialCache, address: Address) -> socketserver.BaseServer:
+    """
+    Serves cache to SocketProviders in other processes from a daemon thread.
+
+    The server hands out tokens without authentication, so a TCP address
+    must be on loopback; anything else raises ValueError.
+
+    Args:
+        cache: The cache whose provider does the actual refreshes.
+        address: Unix socket path, or (host, port) for TCP on loopback.
+
+    Returns:
+        The running server; call shutdown() to stop it.
+    """
+    if isinstance(address, str):
+        if os.path.exists(address):
+            os.unlink(address)
+        server = socketserver.ThreadingUnixStreamServer(address, _CredentialHandler)
+    else:
+        if not _is_loopback(address[0]):
+            raise ValueError(f"Credential server must listen on loopback, not {address[0]!r}")
+        server = socketserver.ThreadingTCPServer(address, _CredentialHandler)
+    server.daemon_threads = True
+    server.cache = cache
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+_default_credentials: Optional[CredentialCache] = None
+
+
+def get_default_credentials() -> Optional[CredentialCache]:
+    """
+    Returns the credential cache shared by Snipes scrapers, or None to use each scraper's bearer.
+    """
+    return _default_credentials
+
+
+def set_default_credentials(credentials: Optional[CredentialCache]):
+    """
+    Makes every Snipes scraper created afterwards (including the Monitor's) use credentials.
+    """
+    global _default_credentials
+    _default_credentials = credentials
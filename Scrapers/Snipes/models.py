@@ -1,20 +1,22 @@
-from dataclasses import dataclass
-from typing import List
-from discord import Embed
+from ..compact import slotted_dataclass
+from typing import TYPE_CHECKING, List
 
-@dataclass
+if TYPE_CHECKING:
+    from discord import Embed
+
+@slotted_dataclass
 class Image:
     """Represents an image of the product."""
     id: int
     link: str
     
-@dataclass
+@slotted_dataclass
 class Price:
     """Price range of the product."""
     min: str # Minimum price (e.g., for variant)
     max: str # Maximum price
     
-@dataclass
+@slotted_dataclass
 class Stock:
     """Represents stock information for a product variant."""
     supplier_id: int # ID of the supplier
@@ -22,7 +24,7 @@ class Stock:
     quantity: int 
     sellable_without_stock: bool # Can be sold even if out of stock
     
-@dataclass 
+@slotted_dataclass
 class Variant:
     """Represents a product variant like size or color."""
     pid: int
@@ -30,7 +32,7 @@ class Variant:
     price: str # Price formatted as string
     size: str # Size label, e.g., '42 EU'
     
-@dataclass
+@slotted_dataclass
 class Product:
     """Main product object parsed from the API response."""
     pid: int
@@ -52,13 +54,15 @@ class Product:
     def __str__(self):
         return f"{self.name} by {self.brand} ({self.sku})"
 
-    def to_embed(self) -> Embed:
+    def to_embed(self) -> "Embed":
         """
         Converts the product data into a Discord Embed object.
 
         Returns:
             Embed: A formatted embed containing product details.
         """
+        from discord import Embed
+
         
         embed = Embed(
             title=self.name,
@@ -1,25 +1,37 @@
 import requests
 import logging
-from models import *
+from .models import *
+from ..decoding import decode
+from ..compact import intern_str, make_model
+from ..metrics import timed
+from .credentials import get_default_credentials
+from ..transport import get_default_transport
+from ..async_transport import get_default_async_transport
 
 class Scraper:
     BASE_URL = "https://api.snipes.com/sni-pl-prd-stor-we-char/v1/v1/products/"
+    AUTH_STATUSES = (401, 403) # Answers to a missing, expired or revoked bearer
     
-    def __init__(self, pid):
+    def __init__(self, pid, transport=None, async_transport=None, lazy=False, credentials=None):
         self.bearer = "" # snipes api bearer for api access, retrieve it by using the chrome dev tool
+        # Optional CredentialCache shared by all scrapers; replaces self.bearer when set
+        self.credentials = credentials or get_default_credentials()
         
         self.pid = pid # Product ID to scrape
+        self.transport = transport or get_default_transport() # Shared pooled HTTP transport
+        self.async_transport = async_transport or get_default_async_transport() # Non-blocking transport
+        self.lazy = lazy # Build images/variants only when first accessed
         
     def _get_url(self):
         return self.BASE_URL + self.pid
     
-    def _get_headers(self):        
+    def _get_headers(self, bearer=None):        
         return {
             'sec-ch-ua-platform': '"macOS"',
             'Referer': '',
             'sec-ch-ua': '"Chromium";v="135", "Not-A.Brand";v="8"',
             'sec-ch-ua-mobile': '?0',
-            'X-Charybdis': self.bearer, # Bearer token is sent as a custom header. If request fails replace it!
+            'X-Charybdis': self.bearer if bearer is None else bearer, # Bearer token is sent as a custom header
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'DNT': '1',
@@ -27,17 +39,38 @@ class Scraper:
     
     def _fetch(self):
         try:
-            headers = self._get_headers() # Get headers
             url = self._get_url() # Build url
-            response = requests.get(url, headers=headers)
+            bearer = self.credentials.get() if self.credentials is not None else self.bearer
+            response = self.transport.get(url, headers=self._get_headers(bearer))
+            if response.status_code in self.AUTH_STATUSES and self.credentials is not None:
+                # Retry once with a fresh token; concurrent rejections share one refresh
+                retry_bearer = self.credentials.rejected(bearer)
+                if retry_bearer != bearer:
+                    response = self.transport.get(url, headers=self._get_headers(retry_bearer))
             response.raise_for_status()
-            return response.json() # Return response data as JSON
+            return decode(response.content) # Return response data as JSON
         except requests.exceptions.RequestException as e:
             logging.error(f"Scrape failed: {e}")
             return None # Return None if request fails
+
+    async def _fetch_async(self):
+        try:
+            url = self._get_url()
+            bearer = await self.credentials.get_async() if self.credentials is not None else self.bearer
+            response = await self.async_transport.get(url, headers=self._get_headers(bearer))
+            if response.status_code in self.AUTH_STATUSES and self.credentials is not None:
+                retry_bearer = await self.credentials.rejected_async(bearer)
+                if retry_bearer != bearer:
+                    response = await self.async_transport.get(url, headers=self._get_headers(retry_bearer))
+            response.raise_for_status()
+            return decode(response.content)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
     
     @staticmethod
-    def _parse_response(product_data):
+    @timed("parse")
+    def _parse_response(product_data, lazy=False):
         # Parse stock data for a variant
         def parse_stock(stock_data):
             return Stock(
@@ -52,8 +85,8 @@ class Scraper:
             return Variant(
                 pid=variant_data['id'],
                 stock=parse_stock(variant_data['stock']),
-                price=variant_data['price']['formatted'],
-                size=variant_data['sizeMap']['size']['value']
+                price=intern_str(variant_data['price']['formatted']),
+                size=intern_str(variant_data['sizeMap']['size']['value'])
             )
         
         # Build image link and return Image object
@@ -83,7 +116,13 @@ class Scraper:
                     .get('value', 'www.snipes.com/'))
         
         # Construct Product object from data
-        return Product(
+        return make_model(
+            Product,
+            lazy,
+            deferred={
+                'images': lambda: [_parse_image(i) for i in product_data['images']],
+                'variants': lambda: [_parse_variant(v) for v in product_data['variants']],
+            },
             pid=product_data['id'],
             sku=product_data['attributes']['manufacturerCode']['values']['label'],
             name=product_data['attributes']['name']['values']['label'],
@@ -94,19 +133,24 @@ class Scraper:
             sold_out=product_data['isSoldOut'],
             masterKey=product_data['masterKey'],
             hot_relase=product_data['attributes']['isHotRelease']['values']['value'],
-            color=product_data['attributes']['color']['values']['label'],
-            brand=product_data['attributes']['brand']['values']['label'],
+            color=intern_str(product_data['attributes']['color']['values']['label']),
+            brand=intern_str(product_data['attributes']['brand']['values']['label']),
             release_date_time=product_data['firstLiveAt'],
-            images=[_parse_image(i) for i in product_data['images']],
-            variants=[_parse_variant(v) for v in product_data['variants']]
-            
         )
             
+    @timed("scrape")
     def scrape_data(self):
         data = self._fetch() # Get data from API
         if data is None:
             return None # Return None if fetch failed
-        return self._parse_response(data) # Parse and return product object
+        return self._parse_response(data, lazy=self.lazy) # Parse and return product object
+
+    @timed("scrape")
+    async def scrape_data_async(self):
+        data = await self._fetch_async() # Get data from API without blocking
+        if data is None:
+            return None
+        return self._parse_response(data, lazy=self.lazy)
         
 if __name__ == "__main__":
     scraper = Scraper("24853") # Initialize scraper
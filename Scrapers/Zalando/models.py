@@ -1,41 +1,43 @@
-from dataclasses import dataclass
-from typing import List
-from discord import Embed
+from ..compact import slotted_dataclass
+from typing import TYPE_CHECKING, Dict, List
 
-@dataclass
+if TYPE_CHECKING:
+    from discord import Embed
+
+@slotted_dataclass
 class Price:
     value: str
     
-@dataclass
+@slotted_dataclass
 class Stock:
     quantity: str
 
-@dataclass
+@slotted_dataclass
 class Offer:
     price: Price 
     stock: Stock
 
-@dataclass
+@slotted_dataclass
 class Variant:
     size: str
     sku: str
     supplierSize: str
     offer: Offer
     
-@dataclass 
+@slotted_dataclass
 class Brand:
     name: str
     id: str
     
-@dataclass
+@slotted_dataclass
 class Color:
     name: str
 
-@dataclass
+@slotted_dataclass
 class Image:
     uri: str
     
-@dataclass
+@slotted_dataclass
 class DeliveryOption:
     label: str
     description: str
@@ -43,7 +45,7 @@ class DeliveryOption:
     kind: str
     
 
-@dataclass
+@slotted_dataclass
 class Product:
     sku: str
     name: str
@@ -60,13 +62,15 @@ class Product:
     def __str__(self):
         return f"{self.name} by {self.brand.name} ({self.group})"
 
-    def to_embed(self) -> Embed:
+    def to_embed(self) -> "Embed":
         """
         Converts the product data into a Discord Embed object.
 
         Returns:
             Embed: A formatted embed containing product details.
         """
+        from discord import Embed
+
         embed = Embed(
             title=self.name,
             url=self.uri,
@@ -95,4 +99,76 @@ class Product:
             embed.set_image(url=self.images[0].uri)
 
         embed.set_footer(text=f"🆔 Brand ID: {self.brand.id}")
-        return embed
\ No newline at end of file
+        return embed
+
+
+@slotted_dataclass
+class VariantStock:
+    sku: str
+    size: str
+    price: str
+    quantity: str
+
+
+@slotted_dataclass
+class StockSnapshot:
+    """Slim stock/price view produced by the stock-only polling mode."""
+    sku: str
+    price: str
+    variants: List[VariantStock]
+
+    def fingerprint(self) -> int:
+        return hash((self.price, tuple((v.sku, v.price, v.quantity) for v in self.variants)))
+
+
+@slotted_dataclass
+class RegionalVariant:
+    size: str
+    sku: str
+    offers: Dict[str, Offer] # Region -> price and stock in that region
+
+
+@slotted_dataclass
+class MultiRegionProduct:
+    sku: str
+    name: str
+    brand: Brand
+    color: Color
+    prices: Dict[str, Price] # Region -> display price
+    variants: List[RegionalVariant]
+    products: Dict[str, Product] # Region -> full product as scraped there
+
+    def __str__(self):
+        return f"{self.name} by {self.brand.name} ({len(self.products)} regions)"
+
+    def to_embed(self) -> "Embed":
+        """
+        Converts the cross-region view into a Discord Embed object.
+
+        Returns:
+            Embed: A formatted embed with per-region prices and stock.
+        """
+        from discord import Embed
+
+        embed = Embed(
+            title=self.name,
+            description=(
+                f"🧾 **SKU:** `{self.sku}`\n"
+                f"🏷️ **Brand:** {self.brand.name}\n"
+                f"🎨 **Color:** {self.color.name}"
+            ),
+        )
+
+        price_text = "\n".join(
+            f"🌍 `{region.upper()}` — {price.value}" for region, price in self.prices.items()
+        )
+        embed.add_field(name="💰 Prices", value=price_text or "None", inline=False)
+
+        for variant in self.variants:
+            stock_text = " | ".join(
+                f"{region.upper()}: {offer.stock.quantity}x"
+                for region, offer in variant.offers.items()
+            )
+            embed.add_field(name=f"🔹 {variant.size}", value=stock_text or "None", inline=False)
+
+        return embed
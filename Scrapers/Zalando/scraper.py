@@ -1,6 +1,15 @@
+import asyncio
+import time
 import requests
 import logging
-from models import *
+from concurrent.futures import ThreadPoolExecutor
+from .models import *
+from ..decoding import DecodeError, decode
+from ..compact import intern_str, make_model
+from ..metrics import timed
+from ..offload import get_default_parse_pool, parse_content, parse_content_async
+from ..transport import get_default_transport
+from ..async_transport import get_default_async_transport
 
 class Scraper:
     REGIONS = { # Zalando region endpoints
@@ -24,10 +33,30 @@ class Scraper:
         "fi": "www.zalando.fi",
     }
 
-    def __init__(self, pid, region):
+    # Minimal projection for stock polling: only sizes, prices and stock
+    STOCK_QUERY = (
+        "query PdpStock($configSku: ID!) { product(id: $configSku) { sku "
+        "displayPrice { original { formatted } } "
+        "simples { sku size offer { price { original { formatted } } stock { quantity } } } } }"
+    )
+    STOCK_QUERY_RETRY = 6 * 60 * 60 # Seconds before a rejected STOCK_QUERY is tried again
+    # GraphQL errors meaning the query itself was refused, not that the product is missing
+    QUERY_ERRORS = (
+        "GRAPHQL_VALIDATION_FAILED", "GRAPHQL_PARSE_FAILED", "PersistedQuery",
+        "Cannot query field", "Unknown argument", "Unknown type", "Syntax Error",
+    )
+    _stock_query_rejected = {} # Host -> time.monotonic() STOCK_QUERY was rejected
+    PRODUCT_PATH = ("data", "product") # Only the product subtree is decoded
+
+    def __init__(self, pid, region, transport=None, async_transport=None, lazy=False, parse_pool=None):
         self.pid = pid.upper() # Make PID uppercase (needed for endpoint)
+        self.transport = transport or get_default_transport() # Shared pooled HTTP transport
+        self.async_transport = async_transport or get_default_async_transport() # Non-blocking transport
         self.url = self._get_region_url(region) # Get correct region endpoint
         self.endpoint = self.url + "/api/graphql/mobile" # API endpoint
+        self.last_snapshot = None # Last StockSnapshot seen by poll()
+        self.lazy = lazy # Build variants/images only when first accessed
+        self.parse_pool = parse_pool or get_default_parse_pool() # Optional ParsePool for large bodies
 
     def _get_region_url(self, region):
         region = region.lower()
@@ -91,28 +120,111 @@ class Scraper:
             },
         }
 
+    def _get_stock_data(self):
+        if self._stock_query_enabled():
+            return {
+                "operationName": "PdpStock",
+                "variables": {"configSku": self.pid},
+                "query": self.STOCK_QUERY,
+            }
+        # Fall back to the persisted Pdp query with every optional part shrunk
+        data = self._get_data()
+        variables = data["variables"]
+        for key in variables:
+            if key.endswith("Width"):
+                variables[key] = 1
+            elif key.startswith("shouldInclude"):
+                variables[key] = False
+        variables["maxFlagCount"] = 0
+        return data
+
+    def _stock_query_enabled(self):
+        rejected_at = self._stock_query_rejected.get(self.url)
+        return rejected_at is None or time.monotonic() - rejected_at > self.STOCK_QUERY_RETRY
+
+    @classmethod
+    def _is_query_error(cls, response_data):
+        for error in response_data.get("errors") or []:
+            text = f"{error.get('message', '')} {(error.get('extensions') or {}).get('code', '')}"
+            if any(marker in text for marker in cls.QUERY_ERRORS):
+                return True
+        return False
+
+    def _handle_stock_response(self, response_data):
+        # Returns the payload, or None if this host rejected the slim query itself
+        product = (response_data.get("data") or {}).get("product")
+        if product is None and self._stock_query_enabled() and self._is_query_error(response_data):
+            logging.info(f"{self.url} rejected the stock query, falling back to Pdp")
+            self._stock_query_rejected[self.url] = time.monotonic()
+            return None
+        return response_data
+
+    def _fetch_stock(self):
+        try:
+            headers = self._get_headers()
+            for _ in range(2):
+                response = self.transport.post(
+                    url="https://" + self.endpoint, json=self._get_stock_data(), headers=headers, idempotent=True, timeout=10
+                )
+                response.raise_for_status()
+                data = self._handle_stock_response(decode(response.content))
+                if data is not None:
+                    return data
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Stock poll failed: {e}")
+        return None
+
+    async def _fetch_stock_async(self):
+        try:
+            headers = self._get_headers()
+            for _ in range(2):
+                response = await self.async_transport.post(
+                    url="https://" + self.endpoint, json=self._get_stock_data(), headers=headers, idempotent=True, timeout=10
+                )
+                response.raise_for_status()
+                data = self._handle_stock_response(decode(response.content))
+                if data is not None:
+                    return data
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Stock poll failed: {e}")
+        return None
+
     def _fetch(self):
         try:
             headers = self._get_headers() # Get request headers
             data = self._get_data() # Get request data
-            response = requests.post(
-                url="https://" + self.endpoint, json=data, headers=headers, timeout=10
+            response = self.transport.post(
+                url="https://" + self.endpoint, json=data, headers=headers, idempotent=True, timeout=10
             )
             response.raise_for_status() # Raise error if status not 200
-            return response.json() # Return response data as JSON
+            return response.content # Raw body, decoded by _parse_content
         except requests.exceptions.RequestException as e:
             logging.error(f"Scrape failed: {e}")
             return None # Return nothing if it fails
 
+    async def _fetch_async(self):
+        try:
+            headers = self._get_headers()
+            data = self._get_data()
+            response = await self.async_transport.post(
+                url="https://" + self.endpoint, json=data, headers=headers, idempotent=True, timeout=10
+            )
+            response.raise_for_status()
+            return response.content
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
+
     @staticmethod
-    def _parse_response(product_data):
+    @timed("parse")
+    def _parse_response(product, lazy=False):
         # Parse price data
         def _parse_price(price_data):
-            return Price(value=price_data["original"]["formatted"])
+            return Price(value=intern_str(price_data["original"]["formatted"]))
 
         # Parse stock data
         def _parse_stock(stock_data):
-            return Stock(quantity=stock_data["quantity"])
+            return Stock(quantity=intern_str(stock_data["quantity"]))
 
         # Parse offer data
         def _parse_offer(offer_data):
@@ -124,52 +236,213 @@ class Scraper:
         # Parse variant data
         def _parse_variant(variant_data):
             return Variant(
-                size=variant_data["size"],
+                size=intern_str(variant_data["size"]),
                 sku=variant_data["sku"],
-                supplierSize=variant_data["supplierSize"],
+                supplierSize=intern_str(variant_data["supplierSize"]),
                 offer=_parse_offer(variant_data["offer"]),
             )
 
         # Parse brand data
         def _parse_brand(brand_data):
-            return Brand(name=brand_data["name"], id=brand_data["id"])
+            return Brand(name=intern_str(brand_data["name"]), id=intern_str(brand_data["id"]))
 
         # Parse color data
         def _parse_color(color_data):
-            return Color(name=color_data["name"])
+            return Color(name=intern_str(color_data["name"]))
 
         # Parse image data
         def _parse_image(image_data):
             return Image(uri=image_data["media"].get("uri", None))
 
-        # Build the Product object
-        return Product(
-            sku=product_data["data"]["product"]["sku"],
-            name=product_data["data"]["product"]["name"],
-            uri=product_data["data"]["product"]["uri"],
-            group=product_data["data"]["product"]["group"],
-            comingSoon=product_data["data"]["product"]["comingSoon"],
-            isActive=product_data["data"]["product"]["isActive"],
-            brand=_parse_brand(product_data["data"]["product"]["brand"]),
-            color=_parse_color(product_data["data"]["product"]["color"]),
-            price=_parse_price(product_data["data"]["product"]["displayPrice"]),
+        # Build the Product object (variants/images only on first access if lazy)
+        return make_model(
+            Product,
+            lazy,
+            deferred={
+                "variants": lambda: [
+                    _parse_variant(v)
+                    for v in product.get("simples", [])
+                ],
+                "images": lambda: [
+                    _parse_image(i)
+                    for i in product.get(
+                        "fullScreenHdGalleryMedia", []
+                    )
+                ],
+            },
+            sku=product["sku"],
+            name=product["name"],
+            uri=product["uri"],
+            group=product["group"],
+            comingSoon=product["comingSoon"],
+            isActive=product["isActive"],
+            brand=_parse_brand(product["brand"]),
+            color=_parse_color(product["color"]),
+            price=_parse_price(product["displayPrice"]),
+        )
+
+    @staticmethod
+    def _parse_stock_response(product_data):
+        product = (product_data.get("data") or {}).get("product")
+        if product is None:
+            # Unknown or delisted SKU
+            logging.error(f"Stock poll failed: no product ({product_data.get('errors')})")
+            return None
+        return StockSnapshot(
+            sku=product["sku"],
+            price=product["displayPrice"]["original"]["formatted"],
             variants=[
-                _parse_variant(v)
-                for v in product_data["data"]["product"].get("simples", [])
-            ],
-            images=[
-                _parse_image(i)
-                for i in product_data["data"]["product"].get(
-                    "fullScreenHdGalleryMedia", []
+                VariantStock(
+                    sku=v["sku"],
+                    size=v["size"],
+                    price=v["offer"]["price"]["original"]["formatted"],
+                    quantity=v["offer"]["stock"]["quantity"],
                 )
+                for v in product.get("simples", [])
             ],
         )
 
-    def scrape_data(self):
-        data = self._fetch() # Fetch data
+    def _needs_scrape(self, snapshot, full):
+        # last_snapshot is only replaced once the change was delivered (see poll)
+        return (
+            full
+            or self.last_snapshot is None
+            or self.last_snapshot.fingerprint() != snapshot.fingerprint()
+        )
+
+    @timed("poll")
+    def poll_stock(self):
+        """
+        Fetches only stock and prices with the smallest query the API accepts.
+
+        Returns:
+            StockSnapshot: Slim stock/price view, or None if the request failed.
+        """
+        data = self._fetch_stock()
+        if data is None:
+            return None
+        return self._parse_stock_response(data)
+
+    @timed("poll")
+    async def poll_stock_async(self):
+        data = await self._fetch_stock_async()
         if data is None:
             return None
-        return self._parse_response(data) # Parse and return
+        return self._parse_stock_response(data)
+
+    def poll(self, full=False):
+        """
+        Polls stock and only scrapes the full product when something changed.
+
+        Returns:
+            tuple: (StockSnapshot, Product or None). The product is only set on
+            the first poll, on a stock/price change or when full is True.
+            (None, None) if a request failed; a change whose full scrape
+            failed is reported again by the next poll.
+        """
+        snapshot = self.poll_stock()
+        if snapshot is None:
+            return None, None
+        if not self._needs_scrape(snapshot, full):
+            return snapshot, None
+        product = self.scrape_data()
+        if product is None:
+            return None, None
+        self.last_snapshot = snapshot
+        return snapshot, product
+
+    async def poll_async(self, full=False):
+        snapshot = await self.poll_stock_async()
+        if snapshot is None:
+            return None, None
+        if not self._needs_scrape(snapshot, full):
+            return snapshot, None
+        product = await self.scrape_data_async()
+        if product is None:
+            return None, None
+        self.last_snapshot = snapshot
+        return snapshot, product
+
+    def _parse_content(self, content):
+        # Decode and parse inline, or in the parse pool if the body is large
+        try:
+            return parse_content(
+                self.parse_pool, self._parse_response, content, self.PRODUCT_PATH, self.lazy
+            )
+        except DecodeError as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
+
+    async def _parse_content_async(self, content):
+        try:
+            return await parse_content_async(
+                self.parse_pool, self._parse_response, content, self.PRODUCT_PATH, self.lazy
+            )
+        except DecodeError as e:
+            logging.error(f"Scrape failed: {e}")
+            return None
+
+    @timed("scrape")
+    def scrape_data(self):
+        content = self._fetch() # Fetch data
+        if content is None:
+            return None
+        return self._parse_content(content) # Parse and return
+
+    @timed("scrape")
+    async def scrape_data_async(self):
+        content = await self._fetch_async() # Fetch data without blocking
+        if content is None:
+            return None
+        return await self._parse_content_async(content)
+
+    @staticmethod
+    def _merge_regions(products):
+        # Combine per-region products into one view, keyed by variant SKU
+        if not products:
+            return None
+        first = next(iter(products.values()))
+        variants = {}
+        for region, product in products.items():
+            for v in product.variants:
+                variant = variants.get(v.sku)
+                if variant is None:
+                    variant = variants[v.sku] = RegionalVariant(size=v.size, sku=v.sku, offers={})
+                variant.offers[region] = v.offer
+        return MultiRegionProduct(
+            sku=first.sku,
+            name=first.name,
+            brand=first.brand,
+            color=first.color,
+            prices={region: product.price for region, product in products.items()},
+            variants=list(variants.values()),
+            products=products,
+        )
+
+    @classmethod
+    def scrape_regions(cls, pid, regions=None, transport=None, max_workers=8):
+        """
+        Scrapes one config SKU in several regions concurrently.
+
+        Returns:
+            MultiRegionProduct: Merged view of every region that answered, or None.
+        """
+        regions = [r.lower() for r in (regions or cls.REGIONS)]
+        scrapers = {region: cls(pid, region, transport=transport) for region in regions}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(scrapers))) as executor:
+            results = dict(zip(scrapers, executor.map(lambda s: s.scrape_data(), scrapers.values())))
+        return cls._merge_regions({r: p for r, p in results.items() if p is not None})
+
+    @classmethod
+    async def scrape_regions_async(cls, pid, regions=None, async_transport=None):
+        """
+        Non-blocking variant of scrape_regions.
+        """
+        regions = [r.lower() for r in (regions or cls.REGIONS)]
+        scrapers = {region: cls(pid, region, async_transport=async_transport) for region in regions}
+        products = await asyncio.gather(*[s.scrape_data_async() for s in scrapers.values()])
+        results = dict(zip(scrapers, products))
+        return cls._merge_regions({r: p for r, p in results.items() if p is not None})
 
 if __name__ == "__main__":
     scraper = Scraper(pid="lls42e00y-q11", region="de") # Initialize scraper with PID and region
@@ -0,0 +1,34 @@
+"""
+Retail scrapers, e.g. ``from Scrapers import NikeScraper``.
+
+Scraper modules are only imported on first access, so importing the package
+(or a single scraper) does not load the others.
+"""
+import importlib
+
+# Exported name -> scraper package
+SCRAPERS = {
+    "NikeScraper": "Nike",
+    "ZalandoScraper": "Zalando",
+    "SnipesScraper": "Snipes",
+    "ShopifyScraper": "Shopify",
+    "LegoScraper": "Lego",
+    "LidlScraper": "Lidl",
+    "KithEUScraper": "KithEU",
+    "LouisVuittonInstoreScraper": "LouisVuittonInstore",
+}
+
+__all__ = list(SCRAPERS)
+
+
+def __getattr__(name):
+    package = SCRAPERS.get(name)
+    if package is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    scraper = importlib.import_module(f".{package}.scraper", __name__).Scraper
+    globals()[name] = scraper # Later lookups skip __getattr__
+    return scraper
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SCRAPERS))
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from . import metrics
+from .decoding import loads
+from .resilience import IDEMPOTENT_METHODS, Resilience, get_default_resilience
+
+
+class AsyncResponse:
+    """
+    Fully read response returned by AsyncTransport.
+
+    Mirrors the parts of requests.Response the scrapers use, so the same
+    error handling (raise_for_status / RequestException) works on both paths.
+    """
+
+    def __init__(self, status_code: int, headers, content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return loads(self.content)
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+class AsyncTransport:
+    """
+    Non-blocking HTTP transport backed by an aiohttp.ClientSession.
+
+    The session keeps per-host keep-alive pools and a DNS cache, so a single
+    event loop can keep thousands of product polls in flight. aiohttp is only
+    imported when the first request is made. Requests go through the same
+    Resilience layer as Transport.
+
+    The session belongs to one event loop. Used from a new loop after the
+    old one finished, the transport closes the old session and opens a new
+    one; using it from two running loops raises RuntimeError.
+    """
+
+    def __init__(
+        self,
+        limit: int = 1000,  # Max open connections in total
+        limit_per_host: int = 32,  # Max open connections per host
+        timeout: float = 10,  # Default total timeout (seconds) per request
+        ttl_dns_cache: int = 300,  # Seconds to cache DNS lookups
+        keepalive_timeout: float = 30,  # Seconds to keep idle connections
+        resilience: Optional[Resilience] = None,  # Defaults to the shared layer
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.resilience = resilience if resilience is not None else get_default_resilience()
+        self._session = None
+        self._loop = None
+
+    def _release_session(self):
+        # Closes a session left behind by a previous event loop
+        session, old_loop = self._session, self._loop
+        self._session = None
+        if session.closed:
+            return
+        if old_loop.is_running():
+            self._session = session
+            raise RuntimeError("AsyncTransport is in use on another event loop; create one per loop")
+        if old_loop.is_closed():
+            # Can't await on a closed loop; its sockets are closed once the session is collected
+            logging.warning("AsyncTransport session outlived its event loop; await close() before the loop ends")
+            return
+        # A loop can't be run from a thread that is already running one
+        closer = threading.Thread(target=old_loop.run_until_complete, args=(session.close(),))
+        closer.start()
+        closer.join()
+
+    def _get_session(self):
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        # Sessions are bound to the loop they were created on
+        if self._session is not None and self._loop is not loop:
+            self._release_session()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, trace_configs=[self._get_trace_config()]
+            )
+            self._loop = loop
+        return self._session
+
+    @staticmethod
+    def _get_trace_config():
+        import aiohttp
+
+        # Reports the connect time of new connections to the metrics sink
+        async def on_request_start(session, context, params):
+            context.host = params.url.host
+
+        async def on_connection_create_start(session, context, params):
+            context.connect_start = time.perf_counter()
+
+        async def on_connection_create_end(session, context, params):
+            if metrics.enabled():
+                elapsed = time.perf_counter() - context.connect_start
+                metrics.observe("connect", elapsed, host=context.host)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        return trace_config
+
+    async def request(
+        self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs
+    ) -> AsyncResponse:
+        """
+        Non-blocking variant of Transport.request().
+        """
+        host = urlsplit(url).netloc
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return await self.resilience.call_async(
+            host, lambda: self._send(method, url, host, **kwargs), idempotent=idempotent
+        )
+
+    async def _send(
+        self, method: str, url: str, host: str, timeout: Optional[float] = None, **kwargs
+    ) -> AsyncResponse:
+        import aiohttp
+
+        session = self._get_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        try:
+            start = time.perf_counter()
+            async with session.request(
+                method, url, timeout=client_timeout, **kwargs
+            ) as response:
+                headers_at = time.perf_counter()
+                content = await response.read()
+                if metrics.enabled():
+                    metrics.record_response(
+                        host, response.status, len(content),
+                        ttfb=headers_at - start, download=time.perf_counter() - headers_at,
+                    )
+                return AsyncResponse(
+                    response.status, response.headers, content, str(response.url)
+                )
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(f"Request to {url} timed out") from e
+        except aiohttp.ClientError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    async def get(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+_default_async_transport: Optional[AsyncTransport] = None
+
+
+def get_default_async_transport() -> AsyncTransport:
+    """
+    Returns the process-wide async transport used when none is injected.
+    """
+    global _default_async_transport
+    if _default_async_transport is None:
+        _default_async_transport = AsyncTransport()
+    return _default_async_transport
+
+
+def set_default_async_transport(transport: AsyncTransport):
+    """
+    Replaces the process-wide async transport.
+    """
+    global _default_async_transport
+    _default_async_transport = transport
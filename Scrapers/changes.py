@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# A fingerprint is (product price, ((variant key, (stock value, variant price)), ...)).
+# Plain tuples hash without building a dict; dicts are only made to diff a change.
+Fingerprint = Tuple[Any, Tuple[Tuple[Hashable, Tuple[Any, Any]], ...]]
+
+OUT_OF_STOCK_VALUES = {"", "0", "OOS", "OUT_OF_STOCK", "NONE", "FALSE"}
+
+
+class EventType(Enum):
+    RESTOCK = "restock"
+    SOLD_OUT = "sold_out"
+    PRICE_CHANGE = "price_change"
+    NEW_VARIANT = "new_variant"
+
+
+@dataclass
+class ChangeEvent:
+    type: EventType
+    retailer: str
+    pid: str
+    variant: Optional[Hashable] # None for product-level price changes
+    old: Any
+    new: Any
+    product: Any # The product the change was detected on
+
+
+def _in_stock(value) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value > 0
+    return str(value).strip().upper() not in OUT_OF_STOCK_VALUES
+
+
+def _nike(product) -> Tuple[str, Fingerprint]:
+    return product.sku, (
+        product.price,
+        tuple((av.pid, (av.level if av.available else "OOS", product.price)) for av in product.availability_variants),
+    )
+
+
+def _zalando(product) -> Tuple[str, Fingerprint]:
+    return product.sku, (
+        product.price.value,
+        tuple((v.sku, (v.offer.stock.quantity, v.offer.price.value)) for v in product.variants),
+    )
+
+
+def _snipes(product) -> Tuple[str, Fingerprint]:
+    return str(product.pid), (
+        (product.price.min, product.price.max),
+        tuple((v.pid, (v.stock.quantity, v.price)) for v in product.variants),
+    )
+
+
+def _kith(product) -> Tuple[str, Fingerprint]:
+    return str(product.pid), (
+        product.price,
+        tuple((v.pid, (v.quantity, v.price)) for v in product.variants),
+    )
+
+
+def _louis_vuitton(product) -> Tuple[str, Fingerprint]:
+    return product.product_id, (
+        product.price,
+        tuple(
+            ((sku.sku, store.identiefer), (store.propertys.available, product.price))
+            for sku in product.skus
+            for store in sku.stores
+        ),
+    )
+
+
+def _shopify(product) -> Tuple[str, Fingerprint]:
+    # products.json carries no stock, so only prices and variants are tracked
+    return str(product.id), (
+        None,
+        tuple((v.id, (True, v.price)) for v in product.variants),
+    )
+
+
+def _lego(product) -> Tuple[str, Fingerprint]:
+    return product.pid, (product.price, ())
+
+
+def _lidl(product) -> Tuple[str, Fingerprint]:
+    return str(product.pid), (product.price, ())
+
+
+# Retailer package name -> fingerprint extractor for its Product model
+EXTRACTORS: Dict[str, Callable] = {
+    "Nike": _nike,
+    "Zalando": _zalando,
+    "Snipes": _snipes,
+    "KithEU": _kith,
+    "LouisVuittonInstore": _louis_vuitton,
+    "Shopify": _shopify,
+    "Lego": _lego,
+    "Lidl": _lidl,
+}
+
+
+def retailer_of(product) -> str:
+    # Models live in Scrapers.<Retailer>.models
+    return type(product).__module__.split(".")[-2]
+
+
+def fingerprint(product) -> Tuple[str, str, Fingerprint]:
+    """
+    Returns (retailer, pid, fingerprint) of a product.
+    """
+    retailer = retailer_of(product)
+    if retailer not in EXTRACTORS:
+        raise ValueError(f"No fingerprint extractor for {type(product).__name__} ({retailer})")
+    pid, fp = EXTRACTORS[retailer](product)
+    return retailer, pid, fp
+
+
+class ChangeDetector:
+    """
+    Diffs successive scrapes of the same products and emits typed events.
+
+    Only a compact fingerprint per product is kept: the product price plus
+    (stock, price) per variant, as tuples next to their hash. A poll whose
+    fingerprint hashes the same as the previous one costs a hash comparison,
+    leaves the state untouched and produces no events; the variants are only
+    turned into dicts to diff a change.
+    """
+
+    def __init__(self, emit_initial: bool = False):
+        self.emit_initial = emit_initial # Emit NEW_VARIANT events for unseen products
+        self._state: Dict[Tuple[str, str], Tuple[int, Fingerprint]] = {}
+
+    def update(self, product) -> List[ChangeEvent]:
+        """
+        Records a fresh scrape and returns the changes since the last one.
+        """
+        if product is None:
+            return []
+        retailer, pid, fp = fingerprint(product)
+        key = (retailer, pid)
+        digest = hash(fp)
+
+        previous = self._state.get(key)
+        if previous is not None and previous[0] == digest:
+            return []
+        self._state[key] = (digest, fp)
+        if previous is None and not self.emit_initial:
+            return []
+
+        old_price, old_variants = previous[1] if previous else (fp[0], ())
+        new_price, new_variants = fp
+        old_variants = dict(old_variants)
+        events = []
+
+        def _event(event_type, variant, old, new):
+            events.append(ChangeEvent(event_type, retailer, pid, variant, old, new, product))
+
+        if old_price != new_price:
+            _event(EventType.PRICE_CHANGE, None, old_price, new_price)
+
+        for variant, (stock, price) in new_variants:
+            old = old_variants.get(variant)
+            if old is None:
+                _event(EventType.NEW_VARIANT, variant, None, stock)
+                continue
+            old_stock, old_variant_price = old
+            was_in_stock, is_in_stock = _in_stock(old_stock), _in_stock(stock)
+            if is_in_stock and not was_in_stock:
+                _event(EventType.RESTOCK, variant, old_stock, stock)
+            elif was_in_stock and not is_in_stock:
+                _event(EventType.SOLD_OUT, variant, old_stock, stock)
+            # Product-level price changes are already reported once above
+            if old_variant_price != price and not (old_variant_price == old_price and price == new_price):
+                _event(EventType.PRICE_CHANGE, variant, old_variant_price, price)
+
+        return events
+
+    def forget(self, retailer: str, pid: str):
+        self._state.pop((retailer, pid), None)
+
+    def __len__(self):
+        return len(self._state)
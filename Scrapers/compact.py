@@ -0,0 +1,127 @@
+import sys
+from dataclasses import dataclass, fields
+
+
+def _add_slots(cls):
+    # Rebuild the class with __slots__ (what dataclass(slots=True) does on 3.10+)
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults already live in the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    qualname = getattr(cls, "__qualname__", None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+    return cls
+
+
+def slotted_dataclass(cls=None, **kwargs):
+    """
+    Drop-in for @dataclass that gives instances __slots__ instead of a __dict__.
+
+    Used by all models so large watchlists hold far less memory per object.
+    """
+
+    def wrap(cls):
+        if sys.version_info >= (3, 10):
+            return dataclass(cls, slots=True, **kwargs)
+        return _add_slots(dataclass(cls, **kwargs))
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+def intern_str(value):
+    """
+    Interns short repeated strings (sizes, currencies, units, stock levels).
+
+    Strings parsed from JSON are new objects on every scrape. Interning lets
+    all products share a single copy of each distinct value.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class _LazyField:
+    """
+    Data descriptor that materializes a deferred field on first access.
+
+    The value is stored in the base model's own slot, so later reads cost a
+    normal attribute lookup and the object otherwise behaves like the base.
+    """
+
+    def __init__(self, name, slot):
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, owner)
+        except AttributeError:
+            value = obj._loaders.pop(self.name)()
+            self.slot.__set__(obj, value)
+            return value
+
+    def __set__(self, obj, value):
+        obj._loaders.pop(self.name, None)
+        self.slot.__set__(obj, value)
+
+
+_lazy_classes = {}
+
+
+def _lazy_class(cls, names):
+    key = (cls, names)
+    lazy_cls = _lazy_classes.get(key)
+    if lazy_cls is None:
+
+        def __eq__(self, other):
+            # Compare like the base model, whether other is lazy or not
+            if not isinstance(other, cls):
+                return NotImplemented
+            return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(cls))
+
+        namespace = {
+            "__eq__": __eq__,
+            "__slots__": ("_loaders",),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            # Pickle (e.g. across processes) as a fully materialized base model
+            "__reduce__": lambda self: (cls, tuple(getattr(self, f.name) for f in fields(cls))),
+        }
+        for name in names:
+            namespace[name] = _LazyField(name, cls.__dict__[name])
+        lazy_cls = _lazy_classes[key] = type(cls.__name__, (cls,), namespace)
+    return lazy_cls
+
+
+def make_model(cls, lazy=False, deferred=None, **values):
+    """
+    Builds a slotted model, optionally deferring expensive fields.
+
+    Args:
+        cls: The model class.
+        lazy: If True, fields in `deferred` are only built on first access.
+        deferred: Field name -> zero-argument function building its value.
+        **values: All other fields.
+
+    Returns:
+        An instance of cls (or of a lazy subclass with the same interface).
+    """
+    deferred = deferred or {}
+    if not lazy:
+        return cls(**values, **{name: load() for name, load in deferred.items()})
+    lazy_cls = _lazy_class(cls, tuple(sorted(deferred)))
+    obj = object.__new__(lazy_cls)
+    for name, value in values.items():
+        cls.__dict__[name].__set__(obj, value)
+    obj._loaders = dict(deferred)
+    return obj
@@ -0,0 +1,113 @@
+import io
+import json
+import time
+from typing import Callable, Optional, Sequence, Union
+
+import requests
+
+from . import metrics
+
+try:
+    import orjson
+
+    _fast_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        _fast_loads = ujson.loads
+    except ImportError:
+        _fast_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+Path = Sequence[Union[str, int]]
+
+_loads: Callable = _fast_loads
+_streaming = False
+
+
+class DecodeError(requests.exceptions.RequestException, ValueError):
+    """Raised when a response body is not valid JSON or lacks the expected subtree."""
+
+
+def set_decoder(loads: Callable):
+    """
+    Replaces the function used to decode response bodies (bytes -> object).
+    """
+    global _loads
+    _loads = loads
+
+
+def set_streaming(enabled: bool):
+    """
+    Enables streaming extraction of subtrees with ijson, if it is installed.
+
+    Streaming builds only the requested subtree, which lowers peak memory for
+    large payloads; with a C backend it can be slower than orjson on small ones.
+    """
+    global _streaming
+    _streaming = enabled and ijson is not None
+
+
+def loads(content):
+    try:
+        return _loads(content)
+    except ValueError as e:
+        raise DecodeError(f"Invalid JSON response: {e}") from e
+
+
+def _walk(data, path: Path):
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            raise DecodeError(f"Response has no {'.'.join(map(str, path))}")
+    return data
+
+
+def _stream(content: bytes, path: Path):
+    # ijson addresses array elements as "item"; only the first match is built
+    prefix = ".".join("item" if isinstance(key, int) else key for key in path)
+    skip = [key for key in path if isinstance(key, int)]
+    if any(skip):
+        # Non-zero array indexes can't be expressed as an ijson prefix
+        return _walk(loads(content), path)
+    try:
+        for item in ijson.items(io.BytesIO(content), prefix, use_float=True):
+            return item
+    except ijson.JSONError as e:
+        raise DecodeError(f"Invalid JSON response: {e}") from e
+    raise DecodeError(f"Response has no {'.'.join(map(str, path))}")
+
+
+def decode(content: bytes, path: Optional[Path] = None):
+    """
+    Decodes a response body with the fastest available JSON library.
+
+    Args:
+        content: Raw response body.
+        path: Optional keys/indexes of the only subtree the caller reads,
+            e.g. ("data", "product"). Only that subtree is returned.
+
+    Returns:
+        The decoded object, or the requested subtree.
+    """
+    if not metrics.enabled():
+        return _decode(content, path)
+    start = time.perf_counter()
+    try:
+        return _decode(content, path)
+    finally:
+        metrics.observe("decode", time.perf_counter() - start)
+
+
+def _decode(content: bytes, path: Optional[Path]):
+    if not path:
+        return loads(content)
+    if _streaming:
+        return _stream(content, path)
+    return _walk(loads(content), path)
@@ -0,0 +1,320 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import fields
+from typing import Optional
+
+import requests
+
+from .async_transport import AsyncTransport
+from .changes import fingerprint
+from .decoding import decode
+from .resilience import Resilience
+
+MAX_EMBEDS = 10 # Discord: embeds per webhook message
+MAX_EMBED_CHARS = 6000 # Discord: characters across all embeds of one message
+
+
+def embed_to_dict(embed) -> dict:
+    """
+    Converts a discord.Embed, a discord_webhook.DiscordEmbed or a dict to webhook JSON.
+    """
+    if isinstance(embed, dict):
+        return embed
+    to_dict = getattr(embed, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    # DiscordEmbed keeps the payload in its attributes, unset ones as None
+    return {key: value for key, value in vars(embed).items() if value not in (None, [], {})}
+
+
+def _embed_chars(embed: dict) -> int:
+    # What Discord counts towards MAX_EMBED_CHARS
+    chars = len(embed.get("title") or "") + len(embed.get("description") or "")
+    chars += len((embed.get("footer") or {}).get("text") or "")
+    chars += len((embed.get("author") or {}).get("name") or "")
+    for field in embed.get("fields") or ():
+        chars += len(str(field.get("name", ""))) + len(str(field.get("value", "")))
+    return chars
+
+
+def product_hash(product) -> str:
+    """
+    Content hash of a product: its change fingerprint plus its scalar fields.
+
+    The fingerprint covers what embeds show per variant (stock, price), so
+    the rest of the nested lists is never walked or repr'd.
+    """
+    try:
+        _, pid, fp = fingerprint(product)
+    except ValueError: # No extractor: fall back to the full repr
+        content = repr(product)
+    else:
+        deferred = getattr(product, "_loaders", ()) # Lazy fields not built yet
+        scalars = []
+        for f in fields(product):
+            if f.name in deferred:
+                continue
+            value = getattr(product, f.name)
+            if value is None or isinstance(value, (str, int, float)):
+                scalars.append(value)
+        content = repr((pid, fp, scalars))
+    content = f"{type(product).__module__}:{content}".encode()
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class EmbedCache:
+    """
+    LRU cache of rendered embeds keyed by the product's content hash.
+
+    An unchanged product maps to the same key, so its to_embed() runs once.
+    The returned dicts are shared and must not be modified.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._embeds = OrderedDict()
+
+    def render(self, product) -> dict:
+        key = product_hash(product)
+        embed = self._embeds.get(key)
+        if embed is not None:
+            self._embeds.move_to_end(key)
+            self.hits += 1
+            return embed
+        self.misses += 1
+        embed = self._embeds[key] = embed_to_dict(product.to_embed())
+        if len(self._embeds) > self.maxsize:
+            self._embeds.popitem(last=False)
+        return embed
+
+    def clear(self):
+        self._embeds.clear()
+
+    def __len__(self):
+        return len(self._embeds)
+
+
+class WebhookDelivery:
+    """
+    Queues embeds and posts them to a Discord webhook in batches.
+
+    Each webhook call carries up to max_embeds embeds within Discord's
+    per-message character budget. The X-RateLimit bucket headers of every
+    response are tracked, so once a window is used up the next call waits
+    for it to reset (while more embeds queue up), and a 429 is retried after
+    its Retry-After. A batch that fails transiently (connection error, 5xx,
+    open breaker, 429 past max_retries) goes back to the front of the queue
+    and is resent after a backoff; only batches Discord rejects are dropped.
+    Products are rendered through an EmbedCache.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        async_transport: Optional[AsyncTransport] = None,
+        max_embeds: int = MAX_EMBEDS,
+        linger: float = 0.5, # Max seconds to wait for a batch to fill up
+        max_queue: int = 10000, # Queued embeds before the oldest are dropped
+        max_retries: int = 5, # Retries of one batch after a 429
+        failure_backoff: float = 2, # Base seconds to wait after a transient failure, doubled per failure
+        max_failure_backoff: float = 60,
+        username: Optional[str] = None, # Overrides the webhook's name
+        cache: Optional[EmbedCache] = None,
+    ):
+        self.url = url
+        # Own transport: webhook POSTs must not be retried blindly (each retry may post
+        # twice) and must not share a breaker with the scrapers
+        self.async_transport = async_transport or AsyncTransport(resilience=Resilience(retries=0))
+        self.max_embeds = min(max_embeds, MAX_EMBEDS)
+        self.linger = linger
+        self.max_queue = max_queue
+        self.max_retries = max_retries
+        self.failure_backoff = failure_backoff
+        self.max_failure_backoff = max_failure_backoff
+        self.username = username
+        self.cache = cache if cache is not None else EmbedCache()
+
+        self.sent_messages = 0
+        self.sent_embeds = 0
+        self.rate_limited = 0
+        self.dropped = 0
+        self.failed = 0
+        self.requeued = 0
+
+        self._failures = 0 # Consecutive transient failures
+
+        self.bucket = None # X-RateLimit-Bucket of the webhook
+        self._remaining = None # Calls left in the current window
+        self._reset_at = 0.0 # time.monotonic() when the window resets
+        self._queue = deque()
+        self._wakeup = None
+        self._running = False
+
+    def send(self, item):
+        """
+        Queues a product (rendered through the cache) or an embed.
+        """
+        embed = self.cache.render(item) if hasattr(item, "to_embed") else embed_to_dict(item)
+        if len(self._queue) >= self.max_queue:
+            self._queue.popleft()
+            self.dropped += 1
+            logging.warning("Delivery queue full, dropped the oldest embed")
+        self._queue.append(embed)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def _next_batch(self) -> list:
+        batch = []
+        chars = 0
+        while self._queue and len(batch) < self.max_embeds:
+            size = _embed_chars(self._queue[0])
+            if batch and chars + size > MAX_EMBED_CHARS:
+                break
+            batch.append(self._queue.popleft())
+            chars += size
+        return batch
+
+    def _update_bucket(self, headers):
+        bucket = headers.get("X-RateLimit-Bucket")
+        if bucket is not None:
+            self.bucket = bucket
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            return
+        try:
+            self._remaining = int(remaining)
+            self._reset_at = time.monotonic() + float(reset_after)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def _retry_after(response) -> float:
+        # The JSON body is more precise (fractional seconds) than the header
+        try:
+            return float(decode(response.content)["retry_after"])
+        except (requests.exceptions.RequestException, KeyError, TypeError, ValueError):
+            pass
+        try:
+            return float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            return 1.0
+
+    async def _wait_for_bucket(self):
+        delay = self._reset_at - time.monotonic()
+        if self._remaining == 0 and delay > 0:
+            await asyncio.sleep(delay)
+        if self._remaining == 0:
+            self._remaining = None
+
+    def _requeue(self, embeds: list) -> bool:
+        # Put the batch back in front and hold the next call off for a backoff
+        self._queue.extendleft(reversed(embeds))
+        self.requeued += 1
+        delay = min(self.max_failure_backoff, self.failure_backoff * 2 ** self._failures)
+        self._failures += 1
+        self._remaining = 0
+        self._reset_at = max(self._reset_at, time.monotonic() + delay)
+        return False
+
+    async def _post(self, embeds: list) -> bool:
+        """
+        Posts one batch; returns False if it was put back in the queue to retry.
+        """
+        payload = {"embeds": embeds}
+        if self.username:
+            payload["username"] = self.username
+
+        for _ in range(self.max_retries + 1):
+            await self._wait_for_bucket()
+            try:
+                response = await self.async_transport.post(self.url, json=payload)
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Webhook delivery failed, requeued: {e}")
+                return self._requeue(embeds)
+            self._update_bucket(response.headers)
+
+            if response.status_code == 429:
+                retry_after = self._retry_after(response)
+                self.rate_limited += 1
+                logging.warning(f"Webhook rate limited, retrying in {retry_after:.2f}s")
+                self._remaining = 0
+                self._reset_at = time.monotonic() + retry_after
+                continue
+
+            if response.status_code >= 500:
+                logging.error(f"Webhook delivery failed with {response.status_code}, requeued")
+                return self._requeue(embeds)
+            self._failures = 0
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                # Discord rejected the payload itself; sending it again won't help
+                logging.error(f"Webhook delivery failed: {e}")
+                self.failed += len(embeds)
+                return True
+            self.sent_messages += 1
+            self.sent_embeds += len(embeds)
+            return True
+
+        logging.error(f"Webhook still rate limited after {self.max_retries} retries, requeued")
+        return self._requeue(embeds)
+
+    async def _send_next(self) -> bool:
+        # Wait out the bucket first, so the batch packs everything queued meanwhile
+        await self._wait_for_bucket()
+        return await self._post(self._next_batch())
+
+    async def flush(self):
+        """
+        Sends everything queued so far without lingering.
+
+        Stops at the first transient failure, leaving the rest queued.
+        """
+        while self._queue:
+            if not await self._send_next():
+                logging.warning(f"Webhook unavailable, {len(self._queue)} embeds left queued")
+                return
+
+    async def run(self):
+        """
+        Delivers queued embeds until stop() is called, then flushes the rest.
+        """
+        self._wakeup = asyncio.Event()
+        self._running = True
+
+        try:
+            while self._running:
+                self._wakeup.clear()
+                if not self._queue:
+                    await self._wakeup.wait()
+                    continue
+
+                # Give a burst a moment to fill the message
+                deadline = time.monotonic() + self.linger
+                while self._running and len(self._queue) < self.max_embeds:
+                    delay = deadline - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        break
+                await self._send_next()
+            await self.flush()
+        finally:
+            self._running = False
+
+    def stop(self):
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
@@ -0,0 +1,276 @@
+import bisect
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence
+
+TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Measurement name -> (Prometheus metric, help text, buckets); buckets None = counter
+METRICS = {
+    "connect": ("scrape_connect_seconds", "Time to open a new connection (DNS, TCP, TLS).", TIME_BUCKETS),
+    "ttfb": ("scrape_ttfb_seconds", "Time from sending a request until its response headers arrived.", TIME_BUCKETS),
+    "download": ("scrape_download_seconds", "Time to read a response body.", TIME_BUCKETS),
+    "decode": ("scrape_decode_seconds", "Time to decode a JSON response body.", TIME_BUCKETS),
+    "parse": ("scrape_parse_seconds", "Time to build the product models.", TIME_BUCKETS),
+    "offload": ("scrape_offload_seconds", "Round trip of a decode and parse in the process pool.", TIME_BUCKETS),
+    "scrape": ("scrape_duration_seconds", "Time of a whole scrape_data call.", TIME_BUCKETS),
+    "batch": ("scrape_batch_duration_seconds", "Time of a whole batch scrape.", TIME_BUCKETS),
+    "poll": ("scrape_poll_duration_seconds", "Time of a whole stock poll.", TIME_BUCKETS),
+    "bytes": ("scrape_response_bytes", "Size of response bodies.", BYTES_BUCKETS),
+    "responses": ("scrape_responses_total", "Responses by status code.", None),
+}
+
+_sink = None
+_retailer = contextvars.ContextVar("retailer", default="")
+
+
+class MetricsSink:
+    """
+    Receives every measurement. Subclass it to forward measurements elsewhere
+    (StatsD, OpenTelemetry, logs); HistogramSink aggregates them in memory.
+    """
+
+    def observe(self, name: str, value: float, labels: Dict[str, str]):
+        raise NotImplementedError
+
+    def increment(self, name: str, labels: Dict[str, str], amount: int = 1):
+        raise NotImplementedError
+
+
+class Histogram:
+    """Cumulative-bucket histogram, as exposed by Prometheus."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1) # Last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            yield bound, total
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels, extra=()) -> str:
+    pairs = [f'{key}="{_escape(value)}"' for key, value in tuple(labels) + tuple(extra)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class HistogramSink(MetricsSink):
+    """
+    Aggregates measurements into per-label-set histograms and counters.
+    """
+
+    def __init__(self):
+        self._histograms = {} # (name, labels) -> Histogram
+        self._counters = {} # (name, labels) -> int
+        self._lock = threading.Lock()
+
+    def observe(self, name, value, labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                buckets = METRICS.get(name, (None, None, TIME_BUCKETS))[2] or TIME_BUCKETS
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def increment(self, name, labels, amount=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def snapshot(self) -> dict:
+        """
+        Returns {"histograms": {(name, labels): (count, sum)}, "counters": {(name, labels): count}}.
+        """
+        with self._lock:
+            return {
+                "histograms": {k: (h.count, h.sum) for k, h in self._histograms.items()},
+                "counters": dict(self._counters),
+            }
+
+    def render_prometheus(self) -> str:
+        """
+        Renders everything in the Prometheus text exposition format.
+        """
+        with self._lock:
+            histograms = {k: (h, list(h.cumulative()), h.sum, h.count) for k, h in self._histograms.items()}
+            counters = dict(self._counters)
+
+        lines = []
+        names = sorted({name for name, _ in histograms} | {name for name, _ in counters})
+        for name in names:
+            metric, help_text, _ = METRICS.get(name, (f"scrape_{name}", name, None))
+            series = [(k, v) for k, v in histograms.items() if k[0] == name]
+            kind = "histogram" if series else "counter"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for (_, labels), (_, buckets, total, count) in sorted(series):
+                for bound, cumulative in buckets:
+                    lines.append(f"{metric}_bucket{_format_labels(labels, [('le', _format_bound(bound))])} {cumulative}")
+                lines.append(f"{metric}_sum{_format_labels(labels)} {total}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {count}")
+            for (counter_name, labels), count in sorted(counters.items()):
+                if counter_name == name:
+                    lines.append(f"{metric}{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def get_metrics_sink() -> Optional[MetricsSink]:
+    return _sink
+
+
+def set_metrics_sink(sink: Optional[MetricsSink]):
+    """
+    Enables instrumentation with the given sink, or disables it with None (the default).
+    """
+    global _sink
+    _sink = sink
+
+
+def enabled() -> bool:
+    return _sink is not None
+
+
+def observe(name: str, value: float, **labels):
+    sink = _sink
+    if sink is None:
+        return
+    labels.setdefault("retailer", _retailer.get())
+    sink.observe(name, value, labels)
+
+
+def increment(name: str, amount: int = 1, **labels):
+    sink = _sink
+    if sink is None:
+        return
+    labels.setdefault("retailer", _retailer.get())
+    sink.increment(name, labels, amount)
+
+
+def record_response(host: str, status: int, size: int, ttfb: float, download: float):
+    """
+    Records one HTTP response (called by the transports).
+    """
+    observe("ttfb", ttfb, host=host)
+    observe("download", download, host=host)
+    observe("bytes", size, host=host)
+    increment("responses", host=host, status=str(status))
+
+
+def submit(executor, fn, *args):
+    """
+    executor.submit() that keeps the caller's retailer label in the worker thread.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def timed(stage: str):
+    """
+    Decorator recording the duration of a scraper method as `stage`.
+
+    The retailer label is taken from the module (Scrapers.<Retailer>.scraper),
+    or left empty when the module runs as __main__. It also applies to
+    requests, decoding and parsing done inside the call.
+    When no sink is set the wrapper only costs one extra call.
+    """
+
+    def decorate(fn):
+        # "Scrapers.Nike.scraper" -> "Nike"; "__main__" (python -m) has no package part
+        parts = fn.__module__.split(".")
+        retailer = parts[-2] if len(parts) > 1 else ""
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _sink is None:
+                    return await fn(*args, **kwargs)
+                token = _retailer.set(retailer)
+                start = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    observe(stage, time.perf_counter() - start, retailer=retailer)
+                    _retailer.reset(token)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _sink is None:
+                return fn(*args, **kwargs)
+            token = _retailer.set(retailer)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(stage, time.perf_counter() - start, retailer=retailer)
+                _retailer.reset(token)
+
+        return wrapper
+
+    return decorate
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        sink = self.server.sink
+        body = sink.render_prometheus().encode() if sink is not None else b""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_prometheus(
+    sink: Optional[HistogramSink] = None, port: int = 9108, addr: str = "0.0.0.0"
+) -> ThreadingHTTPServer:
+    """
+    Serves GET /metrics in the Prometheus text format from a daemon thread.
+
+    Args:
+        sink: Sink to expose. Defaults to a new HistogramSink, which is also
+            installed as the process-wide sink.
+
+    Returns:
+        The running server; call shutdown() to stop it.
+    """
+    if sink is None:
+        sink = HistogramSink()
+        set_metrics_sink(sink)
+    server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.sink = sink
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,222 @@
+import asyncio
+import heapq
+import importlib
+import inspect
+import itertools
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+# Retailer name -> (package module, scraper factory, host resolver)
+RETAILERS = {
+    "nike": (
+        "Nike",
+        lambda cls, entry: cls(entry.region, entry.pid),
+        lambda entry: "api.nike.com",
+    ),
+    "zalando": (
+        "Zalando",
+        lambda cls, entry: cls(entry.pid, entry.region),
+        lambda entry: "zalando." + entry.region.lower(),
+    ),
+    "snipes": (
+        "Snipes",
+        lambda cls, entry: cls(entry.pid),
+        lambda entry: "api.snipes.com",
+    ),
+    "shopify": (
+        "Shopify",
+        lambda cls, entry: cls(entry.pid),
+        lambda entry: urlparse(entry.pid).netloc,
+    ),
+    "lego": (
+        "Lego",
+        lambda cls, entry: cls(entry.pid),
+        lambda entry: "www.lego.com",
+    ),
+    "lidl": (
+        "Lidl",
+        lambda cls, entry: cls(entry.pid),
+        lambda entry: "www.lidl.de",
+    ),
+    "kitheu": (
+        "KithEU",
+        lambda cls, entry: cls(entry.pid),
+        lambda entry: "searchserverapi.com",
+    ),
+    "louisvuitton": (
+        "LouisVuittonInstore",
+        lambda cls, entry: cls(entry.pid, city=entry.region),
+        lambda entry: "api.louisvuitton.com",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class WatchEntry:
+    """A single watched product. For Shopify the pid is the product URL."""
+    retailer: str
+    pid: str
+    region: str = ""
+    interval: Optional[float] = field(default=None, compare=False) # Overrides the monitor interval
+
+    @property
+    def host(self) -> str:
+        return RETAILERS[self.retailer.lower()][2](self)
+
+
+class Monitor:
+    """
+    Long-running poller over a watchlist of products.
+
+    Entries are kept in a heap keyed on their next due time, so the loop
+    sleeps until the earliest entry is due instead of busy-waiting. Polls run
+    through the scrapers' async API, capped per host and globally.
+    """
+
+    def __init__(
+        self,
+        watchlist: Iterable[WatchEntry] = (),
+        interval: float = 60, # Default seconds between polls of one entry
+        jitter: float = 0.1, # Random +/- fraction applied to every interval
+        host_limits: Optional[Dict[str, int]] = None, # Per-host concurrency overrides
+        default_host_limit: int = 8, # Concurrent polls per host if not overridden
+        max_in_flight: int = 1000, # Concurrent polls in total
+        on_result: Optional[Callable] = None, # Called with (entry, product)
+        on_error: Optional[Callable] = None, # Called with (entry, exception)
+        snapshot_store=None, # Optional SnapshotStore every result is recorded in
+    ):
+        self.interval = interval
+        self.jitter = jitter
+        self.host_limits = host_limits or {}
+        self.default_host_limit = default_host_limit
+        self.max_in_flight = max_in_flight
+        self.on_result = on_result
+        self.on_error = on_error
+        self.snapshot_store = snapshot_store
+
+        self._heap = [] # (due, seq, generation, entry)
+        self._seq = itertools.count()
+        self._entries: Dict[WatchEntry, int] = {} # Entry -> generation it was added with
+        self._scrapers = {}
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._slots = None
+        self._wakeup = None
+        self._tasks = set()
+        self._running = False
+
+        for entry in watchlist:
+            self.add(entry)
+
+    def _next_interval(self, entry: WatchEntry) -> float:
+        interval = entry.interval or self.interval
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _schedule(self, entry: WatchEntry, generation: int, due: float):
+        heapq.heappush(self._heap, (due, next(self._seq), generation, entry))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def add(self, entry: WatchEntry):
+        if entry.retailer.lower() not in RETAILERS:
+            raise ValueError(f"Unknown retailer: {entry.retailer}")
+        if entry in self._entries:
+            return
+        generation = self._entries[entry] = next(self._seq)
+        # Spread the first polls so a large watchlist does not fire at once
+        spread = (entry.interval or self.interval) * self.jitter
+        self._schedule(entry, generation, time.monotonic() + random.uniform(0, spread))
+
+    def remove(self, entry: WatchEntry):
+        # Stale heap items (old generations) are skipped when they come due
+        self._entries.pop(entry, None)
+        self._scrapers.pop(entry, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get_scraper(self, entry: WatchEntry):
+        scraper = self._scrapers.get(entry)
+        if scraper is None:
+            package, factory, _ = RETAILERS[entry.retailer.lower()]
+            module = importlib.import_module(f".{package}.scraper", __package__)
+            scraper = factory(module.Scraper, entry)
+            self._scrapers[entry] = scraper
+        return scraper
+
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            limit = self.host_limits.get(host, self.default_host_limit)
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(limit)
+        return semaphore
+
+    @staticmethod
+    async def _call(callback, *args):
+        if callback is None:
+            return
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            await result
+
+    async def _poll(self, entry: WatchEntry, generation: int):
+        try:
+            async with self._get_host_semaphore(entry.host):
+                product = await self._get_scraper(entry).scrape_data_async()
+            if self.snapshot_store is not None and product is not None:
+                self.snapshot_store.record(product)
+            await self._call(self.on_result, entry, product)
+        except Exception as e:
+            logging.error(f"Poll failed for {entry.retailer} {entry.pid}: {e}")
+            try:
+                await self._call(self.on_error, entry, e)
+            except Exception as callback_error:
+                logging.error(f"on_error callback failed: {callback_error}")
+        finally:
+            self._slots.release()
+            if self._entries.get(entry) == generation:
+                due = time.monotonic() + self._next_interval(entry)
+                self._schedule(entry, generation, due)
+
+    async def run(self):
+        """
+        Polls the watchlist until stop() is called.
+        """
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._wakeup = asyncio.Event()
+        self._running = True
+
+        try:
+            while self._running:
+                self._wakeup.clear()
+                if not self._heap:
+                    await self._wakeup.wait()
+                    continue
+
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                _, _, generation, entry = heapq.heappop(self._heap)
+                if self._entries.get(entry) != generation:
+                    continue
+                await self._slots.acquire()
+                task = asyncio.ensure_future(self._poll(entry, generation))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        finally:
+            self._running = False
+            for task in list(self._tasks):
+                task.cancel()
+
+    def stop(self):
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
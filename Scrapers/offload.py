@@ -0,0 +1,143 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from . import metrics
+from .decoding import Path, decode
+
+
+def _init_worker():
+    # A sink inherited through fork would only collect into the worker's copy
+    metrics.set_metrics_sink(None)
+
+
+def decode_and_parse(parse, content: bytes, path: Optional[Path] = None):
+    """
+    Decodes a response body and parses it (runs in the worker process).
+
+    `parse` must be importable by name, e.g. Scraper._parse_response.
+    """
+    return parse(decode(content, path))
+
+
+class ParsePool:
+    """
+    Process pool that decodes and parses large response bodies off the GIL.
+
+    Raw bytes are sent to a worker and the finished models come back pickled
+    (lazy models are always built eagerly there). Bodies below min_size are
+    parsed inline, where pickling would cost more than the parse itself.
+    Workers are started with "spawn", so they inherit no locks, threads or
+    event loops from the monitor.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None, # Defaults to the number of CPUs
+        min_size: int = 16 * 1024, # Smaller bodies (bytes) are parsed inline
+        mp_context=None,
+    ):
+        self.max_workers = max_workers
+        self.min_size = min_size
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=self.mp_context,
+                        initializer=_init_worker,
+                    )
+        return self._executor
+
+    def offloads(self, size: int) -> bool:
+        return size >= self.min_size
+
+    def run(self, fn, *args):
+        """
+        Runs fn(*args) in a worker and returns its result; fn must be picklable.
+        """
+        if not metrics.enabled():
+            return self._get_executor().submit(fn, *args).result()
+        start = time.perf_counter()
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            metrics.observe("offload", time.perf_counter() - start)
+
+    async def run_async(self, fn, *args):
+        """
+        Non-blocking variant of run().
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            metrics.observe("offload", time.perf_counter() - start)
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+
+def parse_content(
+    pool: Optional[ParsePool], parse, content: bytes, path: Optional[Path] = None, lazy: bool = False
+):
+    """
+    Decodes and parses content, in the pool if one is given and content is large.
+
+    Args:
+        pool: ParsePool to use, or None to parse inline.
+        parse: Parse function taking the decoded data and a lazy flag.
+        content: Raw response body.
+        path: Optional subtree to decode (see decoding.decode).
+        lazy: Passed to parse when it runs inline.
+    """
+    if pool is None or not pool.offloads(len(content)):
+        return parse(decode(content, path), lazy=lazy)
+    return pool.run(decode_and_parse, parse, content, path)
+
+
+async def parse_content_async(
+    pool: Optional[ParsePool], parse, content: bytes, path: Optional[Path] = None, lazy: bool = False
+):
+    """
+    Non-blocking variant of parse_content().
+    """
+    if pool is None or not pool.offloads(len(content)):
+        return parse(decode(content, path), lazy=lazy)
+    return await pool.run_async(decode_and_parse, parse, content, path)
+
+
+_default_pool: Optional[ParsePool] = None
+
+
+def get_default_parse_pool() -> Optional[ParsePool]:
+    """
+    Returns the process-wide parse pool, or None if parsing runs inline (the default).
+    """
+    return _default_pool
+
+
+def set_default_parse_pool(pool: Optional[ParsePool]):
+    """
+    Offloads parsing of every scraper created afterwards to pool (None turns it off).
+    """
+    global _default_pool
+    _default_pool = pool
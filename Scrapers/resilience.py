@@ -0,0 +1,314 @@
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Optional
+
+import requests
+
+from . import metrics
+
+COUNTERS = ("requests", "retries", "failures", "hedges", "hedge_wins", "opened", "rejected")
+# Methods safe to send twice; others are only retried or hedged if the caller says so
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"))
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without sending a request while the host's circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: opens after failure_threshold consecutive failures.
+
+    While open every request fails fast. After reset_timeout a single trial
+    request is let through (half-open); its outcome closes or reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> bool:
+        """
+        Returns True if this failure opened the breaker.
+        """
+        with self._lock:
+            self.failures += 1
+            if not self._trial and (self._opened_at is not None or self.failures < self.failure_threshold):
+                return False
+            # A failed trial reopens the breaker for another reset_timeout
+            opened = self._opened_at is None
+            self._opened_at = time.monotonic()
+            self._trial = False
+            return opened
+
+    def release(self):
+        # The trial request ended without an outcome (e.g. it was cancelled)
+        with self._lock:
+            self._trial = False
+
+
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    # Separate from the scrapers' executors, so a hedge never waits on its caller's pool
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="hedge")
+    return _hedge_executor
+
+
+class Resilience:
+    """
+    Retry, hedging and circuit breaking shared by Transport and AsyncTransport.
+
+    Failed requests (RequestException or a status in retry_statuses) are
+    retried with full-jitter exponential backoff. Hosts in hedge_hosts get a
+    duplicate request if the first has not answered after the given delay;
+    whichever answers first wins. Only idempotent requests are retried or
+    hedged; a webhook POST is sent once. Every host has a CircuitBreaker, and
+    while it is open requests raise CircuitOpenError without touching the
+    network.
+    """
+
+    def __init__(
+        self,
+        retries: int = 2, # Extra attempts after the first one
+        backoff: float = 0.2, # Base delay (seconds) of the exponential backoff
+        max_backoff: float = 5, # Cap of a single backoff delay
+        retry_statuses: Iterable[int] = (500, 502, 503, 504),
+        failure_threshold: int = 5, # Consecutive failures that open a breaker (0 disables)
+        reset_timeout: float = 30, # Seconds a breaker stays open before a trial request
+        hedge_hosts: Optional[Dict[str, float]] = None, # Host -> seconds before hedging
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge_hosts = dict(hedge_hosts or {})
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._counters = Counter() # (host, counter) -> count
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> Optional[CircuitBreaker]:
+        if not self.failure_threshold:
+            return None
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    host, CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                )
+        return breaker
+
+    def _count(self, host: str, name: str):
+        with self._lock:
+            self._counters[host, name] += 1
+
+    def stats(self) -> dict:
+        """
+        Returns the counters in total and per host, plus open breakers.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        total = dict.fromkeys(COUNTERS, 0)
+        hosts = {}
+        for (host, name), count in counters.items():
+            total[name] += count
+            hosts.setdefault(host, dict.fromkeys(COUNTERS, 0))[name] = count
+        open_hosts = [host for host, b in list(self._breakers.items()) if b.state != "closed"]
+        return {"total": total, "hosts": hosts, "open": sorted(open_hosts)}
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _before(self, host: str, breaker: Optional[CircuitBreaker]):
+        if breaker is not None and not breaker.allow():
+            self._count(host, "rejected")
+            raise CircuitOpenError(f"Circuit breaker for {host} is open")
+        self._count(host, "requests")
+
+    def _failed(self, host: str, breaker: Optional[CircuitBreaker]):
+        self._count(host, "failures")
+        if breaker is not None and breaker.record_failure():
+            self._count(host, "opened")
+
+    def _hedged(self, host: str, send, delay: float):
+        executor = _get_hedge_executor()
+        first = metrics.submit(executor, send)
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+        self._count(host, "hedges")
+        second = metrics.submit(executor, send)
+        pending = {first, second}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except requests.exceptions.RequestException as e:
+                    error = e
+                    continue
+                if future is second:
+                    self._count(host, "hedge_wins")
+                return result # The loser finishes in the background
+        raise error
+
+    async def _hedged_async(self, host: str, send, delay: float):
+        first = asyncio.ensure_future(send())
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return first.result()
+            self._count(host, "hedges")
+            second = asyncio.ensure_future(send())
+            tasks.add(second)
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        if not isinstance(error, requests.exceptions.RequestException):
+                            raise error
+                        continue
+                    if task is second:
+                        self._count(host, "hedge_wins")
+                    return task.result()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _outcome(self, host, breaker, attempt, retries, response=None, error=None) -> bool:
+        """
+        Records one attempt and returns True if it should be retried.
+        """
+        if error is None and response.status_code not in self.retry_statuses:
+            if breaker is not None:
+                breaker.record_success()
+            return False
+        self._failed(host, breaker)
+        if attempt >= retries:
+            return False
+        self._count(host, "retries")
+        return True
+
+    def call(self, host: str, send, idempotent: bool = True):
+        """
+        Runs send() (one HTTP request) with retries, hedging and the host's breaker.
+
+        Non-idempotent requests only go through the breaker.
+        """
+        breaker = self.breaker(host)
+        hedge_delay = self.hedge_hosts.get(host) if idempotent else None
+        retries = self.retries if idempotent else 0
+        for attempt in range(retries + 1):
+            self._before(host, breaker)
+            try:
+                if hedge_delay is not None:
+                    response = self._hedged(host, send, hedge_delay)
+                else:
+                    response = send()
+            except requests.exceptions.RequestException as e:
+                if not self._outcome(host, breaker, attempt, retries, error=e):
+                    raise
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if not self._outcome(host, breaker, attempt, retries, response=response):
+                    return response
+            time.sleep(self._backoff_delay(attempt))
+
+    async def call_async(self, host: str, send, idempotent: bool = True):
+        """
+        Non-blocking variant of call(); send() returns an awaitable response.
+        """
+        breaker = self.breaker(host)
+        hedge_delay = self.hedge_hosts.get(host) if idempotent else None
+        retries = self.retries if idempotent else 0
+        for attempt in range(retries + 1):
+            self._before(host, breaker)
+            try:
+                if hedge_delay is not None:
+                    response = await self._hedged_async(host, send, hedge_delay)
+                else:
+                    response = await send()
+            except requests.exceptions.RequestException as e:
+                if not self._outcome(host, breaker, attempt, retries, error=e):
+                    raise
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if not self._outcome(host, breaker, attempt, retries, response=response):
+                    return response
+            await asyncio.sleep(self._backoff_delay(attempt))
+
+
+_default_resilience: Optional[Resilience] = None
+
+
+def get_default_resilience() -> Resilience:
+    """
+    Returns the process-wide resilience layer shared by the default transports.
+    """
+    global _default_resilience
+    if _default_resilience is None:
+        with _hedge_lock:
+            if _default_resilience is None:
+                _default_resilience = Resilience()
+    return _default_resilience
+
+
+def set_default_resilience(resilience: Resilience):
+    """
+    Replaces the process-wide resilience layer (e.g. to tune retries or hedging).
+
+    Transports created before the call keep the one they were created with.
+    """
+    global _default_resilience
+    _default_resilience = resilience
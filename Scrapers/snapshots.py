@@ -0,0 +1,171 @@
+import atexit
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .changes import fingerprint
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    retailer TEXT NOT NULL,
+    pid TEXT NOT NULL,
+    variant TEXT NOT NULL, -- '' is the product itself
+    ts REAL NOT NULL,
+    stock TEXT,
+    price TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_lookup
+    ON snapshots (retailer, pid, variant, ts);
+"""
+
+
+def _variant_key(variant) -> str:
+    # LV variants are (sku, store) tuples
+    if isinstance(variant, tuple):
+        return "/".join(str(part) for part in variant)
+    return str(variant)
+
+
+def _to_text(value) -> Optional[str]:
+    # Snipes prices are (min, max) ranges
+    if value is None:
+        return None
+    if isinstance(value, tuple):
+        return "-".join(str(part) for part in value)
+    return str(value)
+
+
+class SnapshotStore:
+    """
+    Local SQLite (WAL mode) history of product stock and prices.
+
+    Rows are buffered and written in one transaction per batch. The
+    (retailer, pid, variant, ts) index turns "last known stock" and
+    "price history" queries into index lookups. With only_changes (the
+    default) a variant row is only written when its stock or price changed,
+    so a busy monitor mostly writes nothing. Buffered rows are written
+    flush_interval seconds after the first one arrived even if no more
+    come, and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        path: str = "snapshots.db",
+        batch_size: int = 500, # Buffered rows that trigger a flush
+        flush_interval: float = 1.0, # Max seconds rows stay buffered
+        only_changes: bool = True,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.only_changes = only_changes
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._last = {} # (retailer, pid, variant) -> (stock, price) last written
+        self._last_flush = time.monotonic()
+        self._timer = None
+        self._closed = False
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        atexit.register(self.close)
+
+    def record(self, product, ts: Optional[float] = None):
+        """
+        Buffers the current stock and prices of a scraped product.
+        """
+        if product is None:
+            return
+        retailer, pid, (price, variants) = fingerprint(product)
+        ts = ts if ts is not None else time.time()
+
+        rows = [(retailer, pid, "", ts, None, _to_text(price))]
+        rows.extend(
+            (retailer, pid, _variant_key(variant), ts, _to_text(stock), _to_text(variant_price))
+            for variant, (stock, variant_price) in variants
+        )
+
+        with self._lock:
+            for row in rows:
+                key = row[:3]
+                value = row[4:]
+                if self.only_changes and self._last.get(key) == value:
+                    continue
+                self._last[key] = value
+                self._buffer.append(row)
+            if (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
+            elif self._buffer and self._timer is None:
+                # Writes the rows even if record() isn't called again
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer or self._closed:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO snapshots (retailer, pid, variant, ts, stock, price) VALUES (?, ?, ?, ?, ?, ?)",
+                self._buffer,
+            )
+        self._buffer = []
+
+    def last_stock(self, retailer: str, pid: str) -> Dict[str, Tuple[Optional[str], Optional[str], float]]:
+        """
+        Returns:
+            dict: Variant -> (stock, price, timestamp) of the latest snapshot.
+        """
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT variant, stock, price, MAX(ts) FROM snapshots "
+                "WHERE retailer = ? AND pid = ? AND variant != '' GROUP BY variant",
+                (retailer, str(pid)),
+            ).fetchall()
+        return {variant: (stock, price, ts) for variant, stock, price, ts in rows}
+
+    def price_history(
+        self, retailer: str, pid: str, days: float = 30, variant: str = ""
+    ) -> List[Tuple[float, Optional[str]]]:
+        """
+        Returns:
+            list: (timestamp, price) for the product (or one variant), oldest first.
+        """
+        self.flush()
+        since = time.time() - days * 24 * 60 * 60
+        with self._lock:
+            return self._conn.execute(
+                "SELECT ts, price FROM snapshots "
+                "WHERE retailer = ? AND pid = ? AND variant = ? AND ts >= ? ORDER BY ts",
+                (retailer, str(pid), variant, since),
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            self._conn.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from . import metrics
+from .resilience import IDEMPOTENT_METHODS, Resilience, get_default_resilience
+
+
+def _timed_connection(connection_cls):
+    class TimedConnection(connection_cls):
+        def connect(self):
+            if not metrics.enabled():
+                return super().connect()
+            start = time.perf_counter()
+            super().connect()
+            metrics.observe("connect", time.perf_counter() - start, host=self.host)
+
+    return TimedConnection
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _timed_connection(HTTPConnection)
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _timed_connection(HTTPSConnection)
+
+
+class _TimedAdapter(HTTPAdapter):
+    # Pools whose connections report their connect time to the metrics sink
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class Transport:
+    """
+    Shared HTTP transport backed by a pooled requests.Session.
+
+    Every host gets its own keep-alive connection pool, so repeated scrapes
+    against the same retailer reuse warm TCP/TLS connections instead of
+    paying a fresh DNS lookup and handshake per request. Requests go
+    through a Resilience layer (retries, hedging, circuit breakers).
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 64,  # Number of per-host pools kept alive
+        pool_maxsize: int = 32,  # Max keep-alive connections per host
+        timeout: float = 10,  # Default timeout (seconds) if caller passes none
+        pool_block: bool = False,  # Block instead of opening extra connections
+        session: Optional[requests.Session] = None,
+        resilience: Optional[Resilience] = None,  # Defaults to the shared layer
+    ):
+        self.timeout = timeout
+        self.resilience = resilience if resilience is not None else get_default_resilience()
+        self.session = session or requests.Session()
+        adapter = _TimedAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request through the resilience layer.
+
+        idempotent defaults to whether the method is; pass True for read-only
+        POSTs (e.g. GraphQL queries) so they are retried and hedged as well.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).netloc
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return self.resilience.call(
+            host, lambda: self._send(method, url, host, **kwargs), idempotent=idempotent
+        )
+
+    def _send(self, method: str, url: str, host: str, **kwargs) -> requests.Response:
+        if not metrics.enabled():
+            return self.session.request(method, url, **kwargs)
+        # Stream so the headers (TTFB) and the body (download) can be timed apart
+        start = time.perf_counter()
+        response = self.session.request(method, url, stream=True, **kwargs)
+        headers_at = time.perf_counter()
+        content = response.content
+        metrics.record_response(
+            host, response.status_code, len(content),
+            ttfb=headers_at - start, download=time.perf_counter() - headers_at,
+        )
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_transport: Optional[Transport] = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """
+    Returns the process-wide transport used by scrapers when none is injected.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_lock:
+            if _default_transport is None:
+                _default_transport = Transport()
+    return _default_transport
+
+
+def set_default_transport(transport: Transport):
+    """
+    Replaces the process-wide transport (e.g. to tune pool sizes or timeouts).
+    """
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
@@ -0,0 +1,58 @@
+"""
+JSON decode cost per response: stdlib json vs the configured fast decoder.
+
+Decodes a large synthetic Zalando Pdp body and reports time per decode and
+peak memory, with and without subtree extraction (streaming needs ijson).
+
+Run from the repository root:
+
+    python -m benchmarks.decoding --iterations 200
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from Scrapers import decoding
+
+from .memory import _zalando_payload
+
+
+def _run(label, func, iterations):
+    func()  # Warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = (time.perf_counter() - start) / iterations
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34}{elapsed * 1e6:>12,.0f} µs{peak / 1024:>12,.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    # Pad the payload like a real Pdp response with lots of unread sections
+    payload = _zalando_payload(1)
+    payload["data"]["product"]["fullScreenHdGalleryMedia"] *= 40
+    payload["extensions"] = {"tracing": [{"path": ["p", n], "duration": n} for n in range(2000)]}
+    content = json.dumps(payload).encode()
+    print(f"Body size: {len(content) / 1024:,.0f} KiB, decoder: {decoding._loads.__module__}")
+    print(f"{'Mode':<34}{'time/decode':>15}{'peak':>16}")
+
+    _run("json.loads (stdlib)", lambda: json.loads(content), args.iterations)
+    _run("decode()", lambda: decoding.decode(content), args.iterations)
+    _run("decode(path=data.product)", lambda: decoding.decode(content, ("data", "product")), args.iterations)
+    if decoding.ijson is not None:
+        decoding.set_streaming(True)
+        _run("decode(path=...) streaming", lambda: decoding.decode(content, ("data", "product")), args.iterations)
+        decoding.set_streaming(False)
+
+
+if __name__ == "__main__":
+    main()
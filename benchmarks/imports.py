@@ -0,0 +1,68 @@
+"""
+Import time of the Scrapers package and of each scraper, in fresh interpreters.
+
+Every measurement runs in a new process (nothing cached in sys.modules) and
+the median of --runs is reported. "with embeds" also imports what the first
+to_embed() call loads (discord, discord_webhook, pytz), which used to happen
+at import time.
+
+Run from the repository root:
+
+    python -m benchmarks.imports --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from Scrapers import SCRAPERS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+EMBED_MODULES = {"LouisVuittonInstore": "discord_webhook", "Nike": "discord, pytz"}
+
+
+def _time_import(statement, runs):
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return None # e.g. discord is not installed
+        samples.append(float(result.stdout))
+    return statistics.median(samples)
+
+
+def _format(seconds):
+    return f"{seconds * 1000:>12,.1f} ms" if seconds is not None else f"{'n/a':>15}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'Import':<30}{'headless':>15}{'with embeds':>15}")
+    print(f"{'Scrapers':<30}{_format(_time_import('import Scrapers', args.runs))}")
+    for name, package in SCRAPERS.items():
+        statement = f"from Scrapers import {name}"
+        embeds = EMBED_MODULES.get(package, "discord")
+        headless = _time_import(statement, args.runs)
+        with_embeds = _time_import(f"{statement}\nimport {embeds}", args.runs)
+        print(f"{name:<30}{_format(headless)}{_format(with_embeds)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Per-product memory footprint of the parsed models, before and after compaction.
+
+"Before" rebuilds every model as a plain @dataclass (per-instance __dict__)
+and disables string interning; "after" uses the slotted models as shipped.
+
+Run from the repository root:
+
+    python -m benchmarks.memory --products 2000
+"""
+import argparse
+import contextlib
+import copy
+import dataclasses
+import gc
+import json
+import tracemalloc
+
+from Scrapers.LouisVuittonInstore import scraper as lv_scraper
+from Scrapers.LouisVuittonInstore.store_directory import StoreDirectory
+from Scrapers.Nike import scraper as nike_scraper
+from Scrapers.Shopify import scraper as shopify_scraper
+from Scrapers.Zalando import scraper as zalando_scraper
+
+SIZES = ["36", "37", "38", "39", "40", "41", "42", "43", "44", "45", "46"]
+
+
+def _zalando_payload(i):
+    return {
+        "data": {
+            "product": {
+                "sku": f"LLS42E00Y-Q{i}",
+                "name": "Sneaker low",
+                "uri": f"https://www.zalando.de/p-{i}.html",
+                "group": "shoes",
+                "comingSoon": False,
+                "isActive": True,
+                "brand": {"name": "Nike Sportswear", "id": "NI1"},
+                "color": {"name": "white"},
+                "displayPrice": {"original": {"formatted": "119,99 €"}},
+                "simples": [
+                    {
+                        "size": size,
+                        "sku": f"LLS42E00Y-Q{i}{n:04d}",
+                        "supplierSize": size,
+                        "offer": {
+                            "price": {"original": {"formatted": "119,99 €"}},
+                            "stock": {"quantity": "MANY"},
+                        },
+                    }
+                    for n, size in enumerate(SIZES)
+                ],
+                "fullScreenHdGalleryMedia": [
+                    {"media": {"uri": f"https://img01.ztat.net/{i}/{n}.jpg"}} for n in range(6)
+                ],
+            }
+        }
+    }
+
+
+def _shopify_payload(i):
+    return {
+        "product": {
+            "id": i,
+            "title": f"Pop! Figure {i}",
+            "vendor": "Funko",
+            "product_type": "Pop!",
+            "handle": f"pop-figure-{i}",
+            "tags": "Star Wars, Pop!, Vinyl",
+            "image": {
+                "id": i, "position": 1, "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z", "alt": None, "width": 1000,
+                "height": 1000, "src": f"https://cdn.shopify.com/{i}.jpg", "variant_ids": [],
+            },
+            "options": [{"id": i, "name": "Size", "position": 1, "values": SIZES}],
+            "images": [
+                {
+                    "id": i * 10 + n, "position": n, "created_at": "2024-01-01T00:00:00Z",
+                    "updated_at": "2024-01-01T00:00:00Z", "alt": None, "width": 1000,
+                    "height": 1000, "src": f"https://cdn.shopify.com/{i}-{n}.jpg",
+                    "variant_ids": [i * 100 + n],
+                }
+                for n in range(4)
+            ],
+            "variants": [
+                {
+                    "id": i * 100 + n, "title": size, "price": "14.99", "sku": f"FK{i}-{n}",
+                    "position": n, "barcode": f"88{i:06d}{n:02d}", "weight": 200,
+                    "weight_unit": "kg", "taxable": True, "requires_shipping": True,
+                    "quantity_rule": {"min": 1, "max": None, "increment": 1},
+                    "price_currency": "EUR",
+                }
+                for n, size in enumerate(SIZES)
+            ],
+        }
+    }
+
+
+def _lv_payload(i):
+    stores = [
+        {
+            "identifier": f"L{n:03d}",
+            "name": f"Louis Vuitton Store {n}",
+            "telephone": "+49 89 0000000",
+            "brand": "Louis Vuitton",
+            "geo": {"latitude": 48.1, "longitude": 11.5},
+            "url": f"https://de.louisvuitton.com/store/{n}",
+            "address": {
+                "streetAddress": f"Residenzstr. {n}", "postalCode": "80333",
+                "addressLocality": "Muenchen", "addressCountry": "DE",
+            },
+            "image": [{"contentUrl": f"https://lv.com/store/{n}.jpg"}],
+            "hoursAvailable": [
+                {"dayOfWeek": day, "opens": "10:00", "closes": "19:00"}
+                for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+            ],
+            "additionalProperty": [
+                {"name": "stockAvailability", "value": "true"},
+                {"name": "availableForCC", "value": "false"},
+            ],
+        }
+        for n in range(12)
+    ]
+    return {
+        "name": f"Neverfull MM {i}",
+        "sku": f"M{i}",
+        "productId": f"nvprod{i}",
+        "webPath": f"/products/{i}",
+        "isBackOrder": False,
+        "sellableStatus": {"sellable": True, "price": {"price": "1.900,00 €"}},
+        "isApplePayEnabled": True,
+        "skus": [
+            {
+                "skuId": f"M{i}{n}", "name": f"Neverfull MM {i}", "size": size,
+                "color": "Monogram", "mediaUrl": f"https://lv.com/{i}/{n}.jpg",
+                "store": copy.deepcopy(stores),
+            }
+            for n, size in enumerate(SIZES[:3])
+        ],
+    }
+
+
+def _nike_payload(i):
+    return {
+        "objects": [
+            {
+                "productInfo": [
+                    {
+                        "merchProduct": {
+                            "labelName": f"Air Force 1 '07 {i}",
+                            "styleColor": f"CW2288-{i:03d}",
+                            "channels": ["Nike.com", "Nike Store Experiences"],
+                            "genders": ["MEN"],
+                            "quantityLimit": 1,
+                            "publishType": "FLOW",
+                            "exclusiveAccess": False,
+                            "commerceStartDate": "2024-01-01T00:00:00.000Z",
+                        },
+                        "merchPrice": {"currentPrice": 119.99, "discounted": False, "currency": "EUR"},
+                        "availableSkus": [
+                            {"id": f"{i}-{n}", "available": True, "level": "HIGH"}
+                            for n in range(len(SIZES))
+                        ],
+                        "skus": [
+                            {"id": f"{i}-{n}", "merchGroup": "EU", "gtin": f"0019{i:06d}{n:02d}", "nikeSize": size}
+                            for n, size in enumerate(SIZES)
+                        ],
+                    }
+                ]
+            }
+        ]
+    }
+
+
+# Retailer -> (scraper module, payload factory, parse function)
+CASES = {
+    "Zalando": (
+        zalando_scraper,
+        _zalando_payload,
+        lambda m, d: m.Scraper._parse_response(d["data"]["product"]),
+    ),
+    "Shopify": (shopify_scraper, _shopify_payload, lambda m, d: m.Scraper._parse_response(d)),
+    "LouisVuittonInstore": (
+        lv_scraper,
+        _lv_payload,
+        lambda m, d: m.Scraper._parse_product(d, _directory),
+    ),
+    "Nike": (nike_scraper, _nike_payload, lambda m, d: m.Scraper._parse_response(d)),
+}
+
+_directory = StoreDirectory()
+
+
+def _plain(cls):
+    # Same fields as the slotted model, but a regular __dict__-backed dataclass
+    specs = []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            specs.append((f.name, f.type, dataclasses.field(default=f.default)))
+        else:
+            specs.append((f.name, f.type))
+    return dataclasses.make_dataclass(cls.__name__, specs)
+
+
+@contextlib.contextmanager
+def _legacy_models(module):
+    # Swap the models referenced by the scraper module for plain dataclasses
+    originals = {
+        name: value
+        for name, value in vars(module).items()
+        if isinstance(value, type) and dataclasses.is_dataclass(value)
+    }
+    originals["intern_str"] = module.intern_str
+    try:
+        for name, value in originals.items():
+            setattr(module, name, _plain(value) if name != "intern_str" else (lambda v: v))
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(module, name, value)
+
+
+def _measure(module, make_payload, parse, count):
+    global _directory
+    _directory = StoreDirectory()
+    # Every payload goes through json so strings are fresh objects, as with response.json()
+    payloads = [json.dumps(make_payload(i)) for i in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    products = [parse(module, json.loads(p)) for p in payloads]
+    gc.collect()
+    # Payload dicts are garbage by now; only the parsed products stay referenced
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del products
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'Retailer':<22}{'before (B/product)':>20}{'after (B/product)':>20}{'saved':>8}")
+    for retailer, (module, make_payload, parse) in CASES.items():
+        with _legacy_models(module):
+            before = _measure(module, make_payload, parse, args.products)
+        after = _measure(module, make_payload, parse, args.products)
+        saved = 1 - after / before
+        print(f"{retailer:<22}{before:>20,.0f}{after:>20,.0f}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
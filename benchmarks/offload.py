@@ -0,0 +1,87 @@
+"""
+Decode+parse throughput inline (fetch threads, one GIL) vs a ParsePool per worker count.
+
+Each case is a large synthetic response: a Zalando product with --scale
+times the usual variants, and a Louis Vuitton product whose store responses
+hold --scale times the usual stores. --threads threads play the fetch
+threads and decode and parse --products bodies, either themselves ("inline")
+or through a ParsePool with 1, 2, 4, ... --max-workers processes.
+
+Run from the repository root:
+
+    python -m benchmarks.offload --products 400 --scale 20 --threads 8
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Scrapers.LouisVuittonInstore.scraper import Scraper as LouisVuittonScraper
+from Scrapers.offload import ParsePool, decode_and_parse
+from Scrapers.Zalando.scraper import Scraper as ZalandoScraper
+
+from . import memory
+
+
+def _zalando_case(scale):
+    payload = memory._zalando_payload(0)
+    product = payload["data"]["product"]
+    product["simples"] = product["simples"] * scale
+    body = json.dumps(payload).encode()
+    return len(body), decode_and_parse, (ZalandoScraper._parse_response, body, ZalandoScraper.PRODUCT_PATH)
+
+
+def _lv_case(scale):
+    product = memory._lv_payload(0)
+    stores = [json.dumps({"hits": sku.pop("store") * scale}).encode() for sku in product["skus"]]
+    return sum(map(len, stores)), LouisVuittonScraper._parse_with_stores, (product, stores)
+
+
+CASES = {
+    "Zalando": _zalando_case,
+    "LouisVuittonInstore": _lv_case,
+}
+
+
+def _throughput(call, products, threads):
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        for _ in executor.map(lambda _: call(), range(products)):
+            pass
+    return products / (time.perf_counter() - start)
+
+
+def _worker_counts(max_workers):
+    count = 1
+    while count < max_workers:
+        yield count
+        count *= 2
+    yield max_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=400)
+    parser.add_argument("--scale", type=int, default=20, help="multiplier of variants/stores per response")
+    parser.add_argument("--threads", type=int, default=8, help="fetch threads handing in bodies")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    counts = list(_worker_counts(args.max_workers))
+    print(f"{args.products} bodies per run, {args.threads} threads, {os.cpu_count()} CPUs; products/s")
+    print(f"{'Case':<22}{'body':>10}{'inline':>10}" + "".join(f"{f'{n} proc':>10}" for n in counts))
+    for name, make_case in CASES.items():
+        size, fn, fn_args = make_case(args.scale)
+        inline = _throughput(lambda: fn(*fn_args), args.products, args.threads)
+        row = f"{name:<22}{size / 1024:>6,.0f} KiB{inline:>10,.0f}"
+        for count in counts:
+            with ParsePool(max_workers=count, min_size=0) as pool:
+                # Start every worker and import the scrapers there before timing
+                _throughput(lambda: pool.run(fn, *fn_args), count * 2, args.threads)
+                row += f"{_throughput(lambda: pool.run(fn, *fn_args), args.products, args.threads):>10,.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
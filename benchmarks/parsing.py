@@ -0,0 +1,75 @@
+"""
+Parse cost per product: eager models vs lazy models (make_model(lazy=True)).
+
+Lazy products skip building variants/images/stores until first accessed,
+but keep the raw response data alive until then. The "touched" column reads
+every deferred field once, i.e. the cost when a cycle does need them.
+
+Run from the repository root:
+
+    python -m benchmarks.parsing --products 2000
+"""
+import argparse
+import dataclasses
+import gc
+import json
+import time
+import tracemalloc
+
+from . import memory
+from .memory import CASES
+
+# Retailer -> lazy parse function, matching CASES
+LAZY = {
+    "Zalando": lambda m, d: m.Scraper._parse_response(d["data"]["product"], lazy=True),
+    "Shopify": lambda m, d: m.Scraper._parse_response(d, lazy=True),
+    "LouisVuittonInstore": lambda m, d: m.Scraper._parse_product(d, memory._directory, lazy=True),
+    "Nike": lambda m, d: m.Scraper._parse_response(d, lazy=True),
+}
+
+
+def _touch(product):
+    for f in dataclasses.fields(product):
+        getattr(product, f.name)
+    return product
+
+
+def _measure(parse, payloads):
+    data = [json.loads(p) for p in payloads]
+    start = time.perf_counter()
+    products = [parse(d) for d in data]
+    elapsed = time.perf_counter() - start
+    del data, products
+
+    gc.collect()
+    tracemalloc.start()
+    # Decode inside the trace: lazy products keep their raw dicts referenced
+    products = [parse(json.loads(p)) for p in payloads]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / len(payloads), size / len(payloads), products
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'Retailer':<22}{'eager':>12}{'lazy':>12}{'touched':>12}{'eager mem':>14}{'lazy mem':>14}")
+    for retailer, (module, make_payload, parse) in CASES.items():
+        payloads = [json.dumps(make_payload(i)) for i in range(args.products)]
+        eager, eager_mem, _ = _measure(lambda d: parse(module, d), payloads)
+        lazy, lazy_mem, products = _measure(lambda d: LAZY[retailer](module, d), payloads)
+        start = time.perf_counter()
+        for product in products:
+            _touch(product)
+        touched = lazy + (time.perf_counter() - start) / len(products)
+        print(
+            f"{retailer:<22}{eager * 1e6:>9,.1f} µs{lazy * 1e6:>9,.1f} µs{touched * 1e6:>9,.1f} µs"
+            f"{eager_mem:>12,.0f} B{lazy_mem:>12,.0f} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
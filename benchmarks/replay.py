@@ -0,0 +1,193 @@
+"""
+Local HTTP stand-in that replays recorded retailer responses.
+
+Scrapers are pointed at the server with ReplayTransport/ReplayAsyncTransport,
+which rewrite https://<host><path> to http://127.0.0.1:<port>/<host><path>.
+Each request is answered from benchmarks/fixtures after the configured latency.
+
+Run from the repository root to serve on its own:
+
+    python -m benchmarks.replay --port 8765 --latency 20 --jitter 10
+"""
+import argparse
+import fnmatch
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from Scrapers.async_transport import AsyncTransport
+from Scrapers.resilience import Resilience
+from Scrapers.transport import Transport
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# (host pattern, path prefix, fixture file), first match wins
+ROUTES = [
+    ("api.nike.com", "/product_feed/threads/", "nike_threads.json"),
+    ("www.zalando.*", "/api/graphql/mobile", "zalando_pdp.json"),
+    ("www.lego.com", "/api/graphql/ProductDetails", "lego_product_details.json"),
+    ("pass-api.louisvuitton.com", "/api/catalog/product/", "lv_catalog.json"),
+    ("api.louisvuitton.com", "/eco-eu/search-merch-eapi/v1/deu-de/stores/query", "lv_stores.json"),
+    ("api.snipes.com", "/sni-pl-prd-stor-we-char/v1/v1/products/", "snipes_product.json"),
+    ("www.lidl.de", "/p/api/gridboxes/", "lidl_gridboxes.json"),
+    ("searchserverapi.com", "/getwidgets", "kith_search.json"),
+    ("*", "/products/", "shopify_product.json"), # Any Shopify store
+]
+
+
+def _load_fixtures():
+    fixtures = {}
+    for _, _, name in ROUTES:
+        with open(os.path.join(FIXTURES, name), "rb") as f:
+            fixtures[name] = f.read()
+    return fixtures
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # Keep-alive, like the real APIs
+    # Send headers and body in one segment; separate small writes hit Nagle +
+    # delayed ACK (~40 ms per response) and swamp the configured latency
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        server = self.server
+        server.delay()
+
+        # Path is /<original host><original path>
+        host, _, path = self.path.lstrip("/").partition("/")
+        path = "/" + path.split("?", 1)[0]
+        body = server.lookup(host, path)
+        if body is None:
+            self.send_response(404)
+            body = b'{"error": "no fixture"}'
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering every route in ROUTES with its fixture.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 0.0, jitter: float = 0.0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.latency = latency # Seconds added to every response
+        self.jitter = jitter # Extra random seconds, uniform in [0, jitter]
+        self.fixtures = _load_fixtures()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def delay(self):
+        seconds = self.latency + random.uniform(0, self.jitter)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def handle_error(self, request, client_address):
+        # Clients dropping keep-alive connections (e.g. at shutdown) are expected
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+    def lookup(self, host, path):
+        for host_pattern, prefix, name in ROUTES:
+            if fnmatch.fnmatch(host, host_pattern) and path.startswith(prefix):
+                return self.fixtures[name]
+        return None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _rewrite(base_url, url):
+    parts = urlsplit(url)
+    query = "?" + parts.query if parts.query else ""
+    return f"{base_url}/{parts.netloc}{parts.path}{query}"
+
+
+def _no_resilience():
+    # Count every failed request instead of retrying or failing fast
+    return Resilience(retries=0, failure_threshold=0)
+
+
+class ReplayTransport(Transport):
+    """
+    Transport that sends every request to a ReplayServer instead of the retailer.
+    """
+
+    def __init__(self, base_url: str, **kwargs):
+        kwargs.setdefault("resilience", _no_resilience())
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def request(self, method, url, **kwargs):
+        return super().request(method, _rewrite(self.base_url, url), **kwargs)
+
+
+class ReplayAsyncTransport(AsyncTransport):
+    """
+    AsyncTransport that sends every request to a ReplayServer instead of the retailer.
+    """
+
+    def __init__(self, base_url: str, **kwargs):
+        kwargs.setdefault("resilience", _no_resilience())
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    async def request(self, method, url, **kwargs):
+        return await super().request(method, _rewrite(self.base_url, url), **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds per response")
+    parser.add_argument("--jitter", type=float, default=0, help="extra random milliseconds")
+    args = parser.parse_args()
+
+    server = ReplayServer(args.port, args.latency / 1000, args.jitter / 1000)
+    print(f"Replaying {len(ROUTES)} routes on {server.base_url}/<host><path>", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
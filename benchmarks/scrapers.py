@@ -0,0 +1,174 @@
+"""
+Offline fetch+parse benchmark of every scraper against the local replay server.
+
+Each scraper runs --iterations scrapes (on --concurrency threads, or tasks
+with --async) against a ReplayServer subprocess that answers from the
+recorded fixtures after --latency ms. Reported per scraper: throughput,
+p50/p99 latency of one scrape_data() call, and the peak memory allocated
+during one scrape (tracemalloc, sequential).
+
+Run from the repository root:
+
+    python -m benchmarks.scrapers --iterations 200 --latency 5 --concurrency 8
+"""
+import argparse
+import asyncio
+import inspect
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import Scrapers
+from Scrapers.LouisVuittonInstore.store_directory import StoreDirectory
+from Scrapers.Nike.channel_cache import ChannelCache
+
+from .replay import ReplayAsyncTransport, ReplayTransport
+
+# Scraper name -> factory(scraper class, transports), one instance per run like the Monitor
+CASES = {
+    "NikeScraper": lambda cls, t: cls("DE", "CW2288-111", **t, channel_cache=ChannelCache()),
+    "ZalandoScraper": lambda cls, t: cls("LLS42E00Y-Q11", "de", **t),
+    "SnipesScraper": lambda cls, t: cls("00013801914536", **t),
+    "ShopifyScraper": lambda cls, t: cls("https://funkoeurope.com/products/darth-vader", **t),
+    "LegoScraper": lambda cls, t: cls("75313", **t),
+    "LidlScraper": lambda cls, t: cls("100270851", **t),
+    "KithEUScraper": lambda cls, t: cls("KHM030123-101", **t),
+    "LouisVuittonInstoreScraper": lambda cls, t: cls(
+        "M13676", city="Muenchen", **t, store_directory=StoreDirectory()
+    ),
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _spawn_server(latency, jitter):
+    # A separate process keeps the server's CPU and allocations out of the numbers
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.replay", "--port", str(port),
+         "--latency", str(latency), "--jitter", str(jitter)],
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("Replay server did not start")
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _run_sync(scraper, iterations, concurrency):
+    latencies = []
+
+    def _scrape(_):
+        start = time.perf_counter()
+        product = scraper.scrape_data()
+        latencies.append(time.perf_counter() - start)
+        return product
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        products = list(executor.map(_scrape, range(iterations)))
+    return time.perf_counter() - start, latencies, products
+
+
+async def _run_async(scraper, iterations, concurrency):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _scrape():
+        async with semaphore:
+            start = time.perf_counter()
+            product = await scraper.scrape_data_async()
+            latencies.append(time.perf_counter() - start)
+            return product
+
+    start = time.perf_counter()
+    products = await asyncio.gather(*[_scrape() for _ in range(iterations)])
+    return time.perf_counter() - start, latencies, products
+
+
+async def _peak_alloc(scrape, samples):
+    peaks = []
+    tracemalloc.start()
+    for _ in range(samples):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = scrape()
+        if inspect.isawaitable(result):
+            await result
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - base)
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0, help="server milliseconds per response")
+    parser.add_argument("--jitter", type=float, default=0, help="extra random server milliseconds")
+    parser.add_argument("--alloc-samples", type=int, default=20)
+    parser.add_argument("--async", dest="use_async", action="store_true", help="use scrape_data_async()")
+    parser.add_argument("--only", nargs="*", default=None, help="scraper names, e.g. NikeScraper")
+    args = parser.parse_args()
+
+    process, base_url = _spawn_server(args.latency, args.jitter)
+    mode = "async" if args.use_async else "sync"
+    print(f"{mode}, {args.iterations} scrapes, concurrency {args.concurrency}, latency {args.latency} ms")
+    print(f"{'Scraper':<28}{'scrapes/s':>11}{'p50':>11}{'p99':>11}{'peak alloc':>14}{'failed':>8}")
+    try:
+        for name, factory in CASES.items():
+            if args.only and name not in args.only:
+                continue
+            cls = getattr(Scrapers, name)
+            transports = {
+                "transport": ReplayTransport(base_url),
+                "async_transport": ReplayAsyncTransport(base_url),
+            }
+            scraper = factory(cls, transports)
+
+            if args.use_async:
+                # One loop for everything, since the aiohttp session is bound to it
+                async def _measure():
+                    await _run_async(scraper, 5, 1) # Warm up connections and caches
+                    result = await _run_async(scraper, args.iterations, args.concurrency)
+                    peak = await _peak_alloc(scraper.scrape_data_async, args.alloc_samples)
+                    await transports["async_transport"].close()
+                    return result + (peak,)
+
+                wall, latencies, products, peak = asyncio.run(_measure())
+            else:
+                _run_sync(scraper, 5, 1) # Warm up connections and caches
+                wall, latencies, products = _run_sync(scraper, args.iterations, args.concurrency)
+                peak = asyncio.run(_peak_alloc(scraper.scrape_data, args.alloc_samples))
+            failed = sum(product is None for product in products)
+            print(
+                f"{name:<28}{args.iterations / wall:>11,.0f}"
+                f"{_percentile(latencies, 50) * 1000:>8,.2f} ms{_percentile(latencies, 99) * 1000:>8,.2f} ms"
+                f"{peak / 1024:>10,.0f} KiB{failed:>8}"
+            )
+            transports["transport"].close()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()